@@ -0,0 +1,43 @@
+"""Add partial index on chapters (story_id, published_date)
+
+Revision ID: 20260223_add_chapter_pub_idx
+Revises: 20260222_add_chapter_tags
+Create Date: 2026-02-23 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260223_add_chapter_pub_idx'
+down_revision: Union[str, Sequence[str], None] = '20260222_add_chapter_tags'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes_chapters = [i['name'] for i in inspector.get_indexes('chapters')]
+    if 'idx_chapter_story_pub' not in indexes_chapters:
+        op.create_index(
+            'idx_chapter_story_pub',
+            'chapters',
+            ['story_id', 'published_date'],
+            sqlite_where=sa.text('published_date IS NOT NULL'),
+            postgresql_where=sa.text('published_date IS NOT NULL')
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes_chapters = [i['name'] for i in inspector.get_indexes('chapters')]
+    if 'idx_chapter_story_pub' in indexes_chapters:
+        op.drop_index('idx_chapter_story_pub', table_name='chapters')
@@ -0,0 +1,62 @@
+"""Add unique index on chapters (story_id, source_url)
+
+Revision ID: 20260225_add_chapter_url_uq
+Revises: 20260224_add_chapter_index_idx
+Create Date: 2026-02-25 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260225_add_chapter_url_uq'
+down_revision: Union[str, Sequence[str], None] = '20260224_add_chapter_index_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes_chapters = [i['name'] for i in inspector.get_indexes('chapters')]
+    if 'uq_chapter_story_url' in indexes_chapters:
+        return
+
+    # Collapse duplicate chapters onto one row so the unique index can be built:
+    # a downloaded copy when there is one (so its file isn't reported missing), else the oldest
+    has_history = 'download_history' in inspector.get_table_names()
+    duplicates = conn.execute(sa.text(
+        "SELECT story_id, source_url FROM chapters "
+        "GROUP BY story_id, source_url HAVING COUNT(*) > 1"
+    )).fetchall()
+    for story_id, source_url in duplicates:
+        keep_id = conn.execute(sa.text(
+            "SELECT id FROM chapters WHERE story_id = :story_id AND source_url = :source_url "
+            "ORDER BY CASE WHEN is_downloaded THEN 0 WHEN local_path IS NOT NULL THEN 1 ELSE 2 END, id "
+            "LIMIT 1"
+        ), {'story_id': story_id, 'source_url': source_url}).scalar()
+        params = {'story_id': story_id, 'source_url': source_url, 'keep_id': keep_id}
+        if has_history:
+            conn.execute(sa.text(
+                "UPDATE download_history SET chapter_id = :keep_id WHERE chapter_id IN ("
+                "SELECT id FROM chapters WHERE story_id = :story_id AND source_url = :source_url AND id != :keep_id)"
+            ), params)
+        conn.execute(sa.text(
+            "DELETE FROM chapters WHERE story_id = :story_id AND source_url = :source_url AND id != :keep_id"
+        ), params)
+
+    op.create_index('uq_chapter_story_url', 'chapters', ['story_id', 'source_url'], unique=True)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes_chapters = [i['name'] for i in inspector.get_indexes('chapters')]
+    if 'uq_chapter_story_url' in indexes_chapters:
+        op.drop_index('uq_chapter_story_url', table_name='chapters')
@@ -0,0 +1,37 @@
+"""Add index on chapters (status, story_id)
+
+Revision ID: 20260226_add_chapter_status_idx
+Revises: 20260225_add_chapter_url_uq
+Create Date: 2026-02-26 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260226_add_chapter_status_idx'
+down_revision: Union[str, Sequence[str], None] = '20260225_add_chapter_url_uq'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes_chapters = [i['name'] for i in inspector.get_indexes('chapters')]
+    if 'idx_chapter_status_story' not in indexes_chapters:
+        op.create_index('idx_chapter_status_story', 'chapters', ['status', 'story_id'])
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)
+
+    indexes_chapters = [i['name'] for i in inspector.get_indexes('chapters')]
+    if 'idx_chapter_status_story' in indexes_chapters:
+        op.drop_index('idx_chapter_status_story', table_name='chapters')
@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 import psutil
@@ -7,11 +8,11 @@ from pathlib import Path
 from typing import Optional, List, Dict
 
 from fastapi import FastAPI, Depends, HTTPException, status, Request, Response, UploadFile, File
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import case, desc, func
 from pydantic import BaseModel
 
 from .database import SessionLocal, Story, Chapter, Source, DownloadHistory, EbookProfile, NotificationSettings
@@ -69,6 +70,19 @@ def get_db():
     finally:
         db.close()
 
+def _chapter_counts(db: Session) -> Dict[int, tuple]:
+    """
+    Returns {story_id: (total, downloaded, failed)} from a single GROUP BY,
+    so progress views don't load every story's chapters.
+    """
+    rows = db.query(
+        Chapter.story_id,
+        func.count(Chapter.id),
+        func.sum(case((Chapter.status == 'downloaded', 1), else_=0)),
+        func.sum(case((Chapter.status == 'failed', 1), else_=0))
+    ).group_by(Chapter.story_id)
+    return {story_id: (total, downloaded, failed) for story_id, total, downloaded, failed in rows}
+
 # Models for API
 class UrlRequest(BaseModel):
     url: str
@@ -185,12 +199,11 @@ async def shutdown_event():
 async def read_root(request: Request, db: Session = Depends(get_db)):
     """Render the dashboard with all stories."""
     stories = db.query(Story).all()
+    counts = _chapter_counts(db)
 
     stories_with_progress = []
     for story in stories:
-        total = len(story.chapters)
-        downloaded = sum(1 for c in story.chapters if c.status == 'downloaded')
-        failed = sum(1 for c in story.chapters if c.status == 'failed')
+        total, downloaded, failed = counts.get(story.id, (0, 0, 0))
         progress = (downloaded / total * 100) if total > 0 else 0
 
         # Add attributes for the template
@@ -294,20 +307,54 @@ async def get_logs(lines: int = 100):
          logger.error(f"Error reading logs: {e}")
          return {"logs": f"Error reading logs: {str(e)}"}
 
+# Marks an exhausted iterator in _stream_json_array
+_STREAM_END = object()
+
+def _stream_json_array(items):
+    """
+    Serializes an iterable of JSON-compatible objects as a JSON array, one item at a time.
+    The first item is pulled before returning, so errors raised while setting up the
+    iterable surface here, while an error response can still be sent.
+    """
+    items = iter(items)
+    head = next(items, _STREAM_END)
+    if head is _STREAM_END:
+        return iter(['[]'])
+    return _iter_json_array(head, items)
+
+def _iter_json_array(head, rest):
+    encoder = json.JSONEncoder()
+    yield '['
+    yield from encoder.iterencode(head)
+    try:
+        for item in rest:
+            yield ','
+            yield from encoder.iterencode(item)
+    except Exception as e:
+        # Headers are already sent; abort the stream so the client sees a truncated body,
+        # not a well-formed but incomplete array
+        logger.error(f"Error streaming calendar events: {e}", exc_info=True)
+        raise
+    yield ']'
+
 @app.get("/api/calendar")
-async def get_calendar_events(response: Response, start: Optional[str] = None, end: Optional[str] = None):
+async def get_calendar_events(start: Optional[str] = None, end: Optional[str] = None):
     """Get calendar events for all stories."""
-    # Prevent caching
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-
     if not story_manager:
         raise HTTPException(status_code=500, detail="StoryManager not initialized")
 
     try:
-        events = story_manager.get_calendar_events(start, end)
-        return events
+        body = _stream_json_array(story_manager.get_calendar_events(start, end))
+        return StreamingResponse(
+            body,
+            media_type="application/json",
+            headers={
+                # Prevent caching
+                "Cache-Control": "no-cache, no-store, must-revalidate",
+                "Pragma": "no-cache",
+                "Expires": "0"
+            }
+        )
     except Exception as e:
         logger.error(f"Error fetching calendar events: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -369,7 +416,6 @@ async def config_source(source_key: str, config: Dict, db: Session = Depends(get
 
     try:
         # Store as JSON string
-        import json
         source.config = json.dumps(config)
         db.commit()
 
@@ -522,12 +568,11 @@ def add_story(request: UrlRequest):
 @app.get("/api/progress")
 async def get_progress(db: Session = Depends(get_db)):
     """Get progress of all stories."""
-    stories = db.query(Story).all()
+    stories = db.query(Story.id, Story.title, Story.status).all()
+    counts = _chapter_counts(db)
     result = []
     for story in stories:
-        total = len(story.chapters)
-        downloaded = sum(1 for c in story.chapters if c.status == 'downloaded')
-        failed = sum(1 for c in story.chapters if c.status == 'failed')
+        total, downloaded, failed = counts.get(story.id, (0, 0, 0))
         progress = (downloaded / total * 100) if total > 0 else 0
 
         result.append({
@@ -17,6 +17,11 @@ class ConfigManager:
         "update_interval_hours": 1,
         "worker_sleep_min": 30.0,
         "worker_sleep_max": 60.0,
+        "download_concurrency": 3,
+        "db_pool_size": 10,
+        "db_max_overflow": 20,
+        "host_rate_limits": {"royalroad.com": 2.0, "archiveofourown.org": 3.0},
+        "strict_orm_loads": False,
         "database_url": "sqlite:///library.db",
         "log_level": "INFO",
         "library_path": "library",
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
+from urllib.parse import urlparse
 
 # The "Contract" for any new website (Royal Road, AO3, etc.)
 class BaseSource(ABC):
@@ -43,23 +44,68 @@ class BaseSource(ABC):
 
 # The "Dispatcher" that picks the right source
 class SourceManager:
+    # Upper bound on remembered URL lookups before the cache is reset
+    URL_CACHE_SIZE = 1024
+
     def __init__(self):
-        self.providers: List[BaseSource] = []
+        self._providers: List[BaseSource] = []
+        self._url_cache: Dict[str, Optional[BaseSource]] = {}
+        self._key_cache: Optional[Dict[str, BaseSource]] = None
+        # Last provider that identified a URL on each host, tried first on cache misses
+        self._host_hints: Dict[str, BaseSource] = {}
+
+    @property
+    def providers(self) -> List[BaseSource]:
+        return self._providers
+
+    @providers.setter
+    def providers(self, providers: List[BaseSource]):
+        self._providers = providers
+        self._invalidate_cache()
+
+    def _invalidate_cache(self):
+        self._url_cache = {}
+        self._key_cache = None
+        self._host_hints = {}
 
     def register_provider(self, provider: BaseSource):
-        self.providers.append(provider)
+        self._providers.append(provider)
+        self._invalidate_cache()
 
     def clear_providers(self):
         self.providers = []
 
     def get_provider_for_url(self, url: str) -> Optional[BaseSource]:
-        for provider in self.providers:
-            if provider.identify(url):
-                return provider
-        return None
+        # Stories are re-resolved on every update pass, so remember each URL's provider
+        try:
+            return self._url_cache[url]
+        except KeyError:
+            pass
+
+        found = None
+        host = urlparse(url).hostname
+        hinted = self._host_hints.get(host)
+        # Providers sharing a host are told apart by identify(), so the hint is only a guess
+        if hinted is not None and hinted.identify(url):
+            found = hinted
+        else:
+            for provider in self._providers:
+                if provider.identify(url):
+                    found = provider
+                    if host:
+                        self._host_hints[host] = provider
+                    break
+
+        if len(self._url_cache) >= self.URL_CACHE_SIZE:
+            self._url_cache = {}
+        self._url_cache[url] = found
+        return found
 
     def get_provider_by_key(self, key: str) -> Optional[BaseSource]:
-        for provider in self.providers:
-            if provider.key == key:
-                return provider
-        return None
+        if self._key_cache is None:
+            # First registered provider wins for a key, as with a linear scan
+            key_cache = {}
+            for provider in self._providers:
+                key_cache.setdefault(provider.key, provider)
+            self._key_cache = key_cache
+        return self._key_cache.get(key)
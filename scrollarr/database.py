@@ -1,6 +1,6 @@
 import os
 import sys
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, ForeignKey, text, DateTime, inspect, event
+from sqlalchemy import create_engine, Column, Integer, String, Boolean, ForeignKey, text, DateTime, inspect, event, Index, insert, update
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker, Session
 from sqlalchemy.sql import func
 from typing import Optional
@@ -58,6 +58,23 @@ class Chapter(Base):
 
     story = relationship("Story", back_populates="chapters")
 
+    __table_args__ = (
+        # Partial index backing the calendar/schedule queries on dated chapters
+        Index(
+            'idx_chapter_story_pub', 'story_id', 'published_date',
+            sqlite_where=text('published_date IS NOT NULL'),
+            postgresql_where=text('published_date IS NOT NULL')
+        ),
+        # Ordered chapter listings and last-chapter lookups
+        Index('idx_chapter_story_index', 'story_id', 'index'),
+        # A chapter URL appears once per story; new chapters are inserted with ON CONFLICT DO NOTHING
+        Index('uq_chapter_story_url', 'story_id', 'source_url', unique=True),
+        # Download queue: pending/failed chapters across all stories, grouped by story
+        Index('idx_chapter_status_story', 'status', 'story_id'),
+        # Covers list_stories' per-story downloaded/total counts without touching table rows
+        Index('idx_chapter_story_downloaded', 'story_id', 'is_downloaded'),
+    )
+
     def __repr__(self):
         return f"<Chapter(title='{self.title}', story_id={self.story_id})>"
 
@@ -123,23 +140,60 @@ if not DB_URL:
     DB_URL = config_manager.get("database_url", "sqlite:///library.db")
 
 connect_args = {}
+engine_kwargs = {}
 if DB_URL.startswith("sqlite"):
     connect_args["check_same_thread"] = False
 
-engine = create_engine(DB_URL, connect_args=connect_args)
-
-if DB_URL.startswith("sqlite"):
-    @event.listens_for(engine, "connect")
+if ":memory:" not in DB_URL and DB_URL not in ("sqlite://", "sqlite:///"):
+    # Size the pool for the web UI and background jobs sharing the engine
+    engine_kwargs["pool_size"] = config_manager.get("db_pool_size", 10)
+    engine_kwargs["max_overflow"] = config_manager.get("db_max_overflow", 20)
+    engine_kwargs["pool_timeout"] = 30
+    if not DB_URL.startswith("sqlite"):
+        # Only networked databases drop idle connections; a ping is wasted on a local file
+        engine_kwargs["pool_pre_ping"] = True
+        engine_kwargs["pool_recycle"] = 1800
+
+engine = create_engine(DB_URL, connect_args=connect_args, **engine_kwargs)
+
+def configure_sqlite_engine(sqlite_engine):
+    """Applies the connection PRAGMAs to every new SQLite connection of the engine."""
+    @event.listens_for(sqlite_engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):
         cursor = dbapi_connection.cursor()
+        # WAL + synchronous=NORMAL: commits skip the per-transaction fsync. The database
+        # cannot be corrupted, but a power loss may drop the last few committed transactions.
         cursor.execute("PRAGMA journal_mode=WAL")
         cursor.execute("PRAGMA synchronous=NORMAL")
         cursor.execute("PRAGMA busy_timeout=30000")
         cursor.execute("PRAGMA foreign_keys=ON")
+        # Sorts/temp indexes (GROUP BY counts, calendar ordering) stay in RAM; reads use a 256 MB mmap window
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
         cursor.close()
 
+if DB_URL.startswith("sqlite"):
+    configure_sqlite_engine(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def begin_write_transaction(session: Session):
+    """
+    Opens the session's transaction as a write transaction, for use right before
+    session.begin_nested() savepoints.
+
+    pysqlite only sends BEGIN ahead of INSERT/UPDATE/DELETE, so on SQLite a SAVEPOINT
+    issued first would start a transaction of its own and its RELEASE would commit.
+    BEGIN IMMEDIATE takes the write lock up front instead, so the transaction never
+    holds a read snapshot that a concurrent commit could make stale. Call it after
+    any network I/O and commit or roll back promptly.
+    """
+    connection = session.connection()
+    if connection.dialect.name != 'sqlite':
+        return
+    if not connection.connection.dbapi_connection.in_transaction:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
 def run_migrations():
     """Run Alembic migrations programmatically."""
     print("Checking for database migrations...")
@@ -208,31 +262,42 @@ def sync_story(url: str, session: Optional[Session] = None):
             story.title = metadata.get('title', story.title)
             story.author = metadata.get('author', story.author)
 
-        # If story is new, story.chapters is empty.
-        # If story exists, story.chapters contains current DB chapters.
-        existing_chapters = {}
-        if story.chapters:
-             existing_chapters = {c.source_url: c for c in story.chapters}
+        # Only the columns needed for the diff; no Chapter objects are loaded
+        existing_chapters = {
+            row.source_url: row
+            for row in session.query(Chapter.id, Chapter.source_url, Chapter.index).filter(Chapter.story_id == story.id)
+        }
 
-        new_chapters_count = 0
+        new_rows = []
+        seen_urls = set()
+        index_updates = []
         for i, chapter_data in enumerate(chapters_data):
             chapter_url = chapter_data['url']
             chapter_title = chapter_data['title']
 
-            if chapter_url not in existing_chapters:
-                new_chapter = Chapter(
-                    title=chapter_title,
-                    source_url=chapter_url,
-                    index=i + 1
-                )
-                # Associate with story
-                story.chapters.append(new_chapter)
-                new_chapters_count += 1
-            else:
+            # Guard against the same URL appearing twice in one listing; the first one wins
+            if chapter_url in seen_urls:
+                continue
+            seen_urls.add(chapter_url)
+
+            existing_chap = existing_chapters.get(chapter_url)
+            if existing_chap is None:
+                new_rows.append({
+                    'story_id': story.id,
+                    'title': chapter_title,
+                    'source_url': chapter_url,
+                    'index': i + 1
+                })
+            elif existing_chap.index != i + 1:
                 # Update index if it's missing or changed
-                existing_chap = existing_chapters[chapter_url]
-                if existing_chap.index != i + 1:
-                    existing_chap.index = i + 1
+                index_updates.append({'id': existing_chap.id, 'index': i + 1})
+
+        # One multi-row INSERT and one executemany UPDATE instead of a statement per chapter
+        if new_rows:
+            session.execute(insert(Chapter), new_rows)
+        if index_updates:
+            session.execute(update(Chapter), index_updates)
+        new_chapters_count = len(new_rows)
 
         if new_chapters_count > 0:
             story.last_updated = func.now()
@@ -4,6 +4,7 @@ from ebooklib import epub
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from .library_manager import LibraryManager
 
@@ -20,6 +21,60 @@ except ImportError:
     HAS_REPORTLAB = False
     print("Warning: ReportLab not installed. PDF generation will be disabled.")
 
+# Cheap pre-check so chapters without images skip the HTML parse/serialize round trip
+_IMG_TAG_RE = re.compile(r'<img\b', re.IGNORECASE)
+
+# Chapter files are read in parallel; compilation is latency-bound on slow or network storage
+CHAPTER_READ_WORKERS = 8
+
+
+def _read_chapter_file(path: Optional[str]):
+    """
+    Reads a chapter's saved HTML.
+    Returns None when there is no file, or the exception if reading it failed.
+    """
+    if not path:
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        return e
+
+class _FileChapterHtml(epub.EpubHtml):
+    """
+    EpubHtml whose body is read from the chapter file when the book is written,
+    so a compiled EPUB holds one chapter in memory at a time rather than all of them.
+    """
+    def __init__(self, path: str, heading: str, **kwargs):
+        self._path = path
+        self._heading = heading
+        super().__init__(**kwargs)
+
+    @property
+    def content(self):
+        with open(self._path, 'r', encoding='utf-8') as f:
+            return f'<h1>{self._heading}</h1>{f.read()}'
+
+    @content.setter
+    def content(self, value):
+        # EpubItem.__init__ assigns a default; the file is the source of truth
+        pass
+
+
+class _FileImage(epub.EpubImage):
+    """EpubImage read from disk only when the book is written."""
+    def __init__(self, path: str):
+        super().__init__()
+        self._path = path
+
+    def get_content(self, default=None):
+        with open(self._path, 'rb') as f:
+            return f.read()
+
+
 class EbookBuilder:
     def __init__(self):
         self.library_manager = LibraryManager()
@@ -27,6 +82,8 @@ class EbookBuilder:
     def make_epub(self, title: str, author: str, chapters: List[Dict[str, str]], output_path: str, cover_path: Optional[str] = None, css: Optional[str] = None, images: List[str] = None):
         """
         Generates an EPUB file from story metadata and chapter content.
+        Each chapter dict carries either 'content' or a 'path' to an HTML file
+        that is read when the EPUB is written.
         """
         book = epub.EpubBook()
 
@@ -52,10 +109,10 @@ class EbookBuilder:
             for img_path in images:
                 try:
                     filename = os.path.basename(img_path)
-                    with open(img_path, 'rb') as f:
-                        img_content = f.read()
+                    if not os.path.exists(img_path):
+                        raise FileNotFoundError(img_path)
 
-                    epub_img = epub.EpubImage()
+                    epub_img = _FileImage(img_path)
                     epub_img.file_name = f"images/{filename}"
 
                     # Detect mime type
@@ -66,7 +123,6 @@ class EbookBuilder:
                     elif ext == 'webp': mime = 'image/webp'
 
                     epub_img.media_type = mime
-                    epub_img.content = img_content
                     book.add_item(epub_img)
                 except Exception as e:
                     print(f"Error adding image {img_path}: {e}")
@@ -75,13 +131,16 @@ class EbookBuilder:
         epub_chapters = []
         for i, chapter_data in enumerate(chapters):
             chapter_title = chapter_data.get('title', f'Chapter {i+1}')
-            chapter_content = chapter_data.get('content', '')
 
             # Create chapter file name
             file_name = f'chapter_{i+1}.xhtml'
 
-            c = epub.EpubHtml(title=chapter_title, file_name=file_name, lang='en')
-            c.content = f'<h1>{chapter_title}</h1>{chapter_content}'
+            chapter_path = chapter_data.get('path')
+            if chapter_path:
+                c = _FileChapterHtml(chapter_path, chapter_title, title=chapter_title, file_name=file_name, lang='en')
+            else:
+                c = epub.EpubHtml(title=chapter_title, file_name=file_name, lang='en')
+                c.content = f'<h1>{chapter_title}</h1>{chapter_data.get("content", "")}'
 
             book.add_item(c)
             epub_chapters.append(c)
@@ -408,12 +467,31 @@ class EbookBuilder:
         # Prepare content
         epub_chapters = []
         epub_images = []
+        seen_images = set()
+
+        # Only paths go to the workers; ORM objects stay on this thread. map() keeps chapter order.
+        # EPUB chapters without images are passed by path and streamed at write time
+        stream_plain_chapters = output_format != 'pdf'
+        workers = max(1, min(CHAPTER_READ_WORKERS, len(chapters)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consumed lazily so plain chapters' text can be dropped once checked
+            contents = executor.map(_read_chapter_file, [chapter.local_path for chapter in chapters])
+
+            for chapter, content in zip(chapters, contents):
+                if content is None:
+                    print(f"Warning: Chapter {chapter.title} (ID: {chapter.id}) is missing content.")
+                    continue
+                if isinstance(content, Exception):
+                    print(f"Warning: Could not read chapter {chapter.title}: {content}")
+                    continue
 
-        for chapter in chapters:
-            if chapter.local_path and os.path.exists(chapter.local_path):
                 try:
-                    with open(chapter.local_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    if not _IMG_TAG_RE.search(content):
+                        if stream_plain_chapters:
+                            epub_chapters.append({'title': chapter.title, 'path': chapter.local_path})
+                        else:
+                            epub_chapters.append({'title': chapter.title, 'content': content})
+                        continue
 
                     # Process images
                     soup = BeautifulSoup(content, 'html.parser')
@@ -433,7 +511,8 @@ class EbookBuilder:
                                 continue
 
                             if abs_img_path.exists():
-                                if str(abs_img_path) not in epub_images:
+                                if str(abs_img_path) not in seen_images:
+                                    seen_images.add(str(abs_img_path))
                                     epub_images.append(str(abs_img_path))
 
                                 if output_format == 'pdf':
@@ -451,8 +530,6 @@ class EbookBuilder:
                     epub_chapters.append({'title': chapter.title, 'content': content})
                 except Exception as e:
                     print(f"Warning: Could not read chapter {chapter.title}: {e}")
-            else:
-                print(f"Warning: Chapter {chapter.title} (ID: {chapter.id}) is missing content.")
 
         if not epub_chapters:
             raise ValueError(f"No content found for {suffix}.")
@@ -126,7 +126,7 @@ class JobManager:
 
         try:
             # Only get IDs to close session early and avoid holding it during network requests
-            monitored_story_ids = [s.id for s in session.query(Story).filter(Story.is_monitored == True).all()]
+            monitored_story_ids = [row.id for row in session.query(Story.id).filter(Story.is_monitored == True)]
         except Exception as e:
             logger.error(f"Error fetching monitored stories: {e}")
             monitored_story_ids = []
@@ -139,6 +139,7 @@ class JobManager:
                 break
 
             try:
+                # One short session per story, so a failure or a slow source affects only that story
                 self.story_manager.check_story_updates(story_id)
             except Exception as e:
                 logger.error(f"Error updating story {story_id}: {e}")
@@ -209,8 +210,8 @@ class JobManager:
                     self.library_manager.ensure_directories(filepath.parent)
 
                     # Write file to disk
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                    with open(filepath, 'wb') as f:
+                        f.write(content.encode('utf-8'))
 
                     # The Update: Once the file is written to disk, update the status from pending to downloaded.
                     chapter.local_path = str(filepath)
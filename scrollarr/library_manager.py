@@ -8,6 +8,38 @@ from .database import Chapter
 
 logger = logging.getLogger(__name__)
 
+
+class _LegacyTitleTable(dict):
+    """
+    str.translate table for legacy safe titles: keeps letters, digits and spaces,
+    drops everything else. Entries are filled in on first sight of a code point,
+    so repeat characters are handled entirely in C.
+    """
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = char if (char.isalpha() or char.isdigit() or char == ' ') else None
+        self[codepoint] = value
+        return value
+
+
+class _FilenameTable(dict):
+    """str.translate table for sanitize_filename: keeps alphanumerics, space, dot, hyphen and underscore."""
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = char if (char.isalnum() or char in ' -_.') else None
+        self[codepoint] = value
+        return value
+
+
+_LEGACY_TITLE_TABLE = _LegacyTitleTable()
+_FILENAME_TABLE = _FilenameTable()
+
+
+def legacy_safe_title(title: str) -> str:
+    """Returns the title as used in legacy ({id}_{safe_title}) folder and file names."""
+    return title.translate(_LEGACY_TITLE_TABLE).rstrip().replace(' ', '_')
+
+
 class LibraryManager:
     def __init__(self):
         self.config = config_manager
@@ -22,8 +54,7 @@ class LibraryManager:
         if not name:
             return "unknown"
         # Keep alphanumeric, space, dot, hyphen, underscore
-        safe = "".join([c for c in name if c.isalnum() or c in (' ', '-', '_', '.')]).strip()
-        return safe
+        return name.translate(_FILENAME_TABLE).strip()
 
     def format_string(self, template: str, context: dict) -> str:
         """Formats a string using the given context, with sanitization."""
@@ -181,7 +212,7 @@ class LibraryManager:
             old_download_path = Path(self.config.get('download_path', 'verification_downloads')).resolve()
 
             # Reconstruct old safe title logic
-            safe_title = "".join([c for c in story.title if c.isalpha() or c.isdigit() or c==' ']).rstrip().replace(' ', '_')
+            safe_title = legacy_safe_title(story.title)
             old_dir_name = f"{story.id}_{safe_title}"
             old_dir_path = old_download_path / old_dir_name
 
@@ -221,7 +252,7 @@ class LibraryManager:
                         src = Path(chapter.local_path)
                     else:
                         # Try to guess
-                        safe_chap_title = "".join([c for c in chapter.title if c.isalpha() or c.isdigit() or c==' ']).rstrip().replace(' ', '_')
+                        safe_chap_title = legacy_safe_title(chapter.title)
                         guess_filename = f"{chapter.id}_{safe_chap_title}.html"
                         src = old_dir_path / guess_filename
 
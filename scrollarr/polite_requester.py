@@ -1,9 +1,103 @@
 import time
 import random
+import threading
 import requests
-from typing import Dict, Optional
+from collections import OrderedDict
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple
 from .config import config_manager
 
+# Total body bytes kept for conditional re-requests (table-of-contents pages)
+REVALIDATE_CACHE_BYTES = 16 * 1024 * 1024
+
+# Requests per second allowed to each host, shared by every requester in the process.
+# Overridable with the 'host_rate_limits' config key.
+DEFAULT_HOST_RATE_LIMITS = {
+    'royalroad.com': 2.0,
+    'archiveofourown.org': 3.0,
+}
+
+# Retries after a 429 Too Many Requests before giving up
+MAX_RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 5.0
+# Longest Retry-After (seconds) worth waiting for; a server asking for more gets the 429 raised
+MAX_RETRY_AFTER = 300.0
+
+
+class HostLimiter:
+    """
+    Spaces requests to one host at least 1/rps seconds apart, across threads.
+    Each caller reserves the next free slot under the lock and sleeps outside it.
+    """
+    def __init__(self, rps: float):
+        self.rps = rps
+        self.interval = 1.0 / rps
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+_host_limiters: Dict[str, HostLimiter] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def _limiter_for(url: str) -> Optional[HostLimiter]:
+    """
+    Returns the shared limiter for the URL's host, or None when the host is unlimited.
+    The rate is read from the config on every call, so a limiter is replaced as soon as
+    'host_rate_limits' changes rather than at the next restart.
+    """
+    host = urlparse(url).hostname or ''
+    limits = config_manager.get('host_rate_limits', DEFAULT_HOST_RATE_LIMITS) or {}
+    rps = next((rate for domain, rate in limits.items() if host == domain or host.endswith('.' + domain)), None)
+    if not rps:
+        return None
+    limiter = _host_limiters.get(host)
+    if limiter is not None and limiter.rps == rps:
+        return limiter
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None or limiter.rps != rps:
+            limiter = _host_limiters[host] = HostLimiter(rps)
+        return limiter
+
+
+def _retry_after_seconds(response: requests.Response, attempt: int) -> float:
+    """
+    Delay before retrying a 429: the server's Retry-After when given in seconds, else exponential backoff with jitter.
+    The result may exceed MAX_RETRY_AFTER; callers give up rather than wait that long.
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after and retry_after.strip().isdigit():
+        return float(retry_after)
+    return RATE_LIMIT_BACKOFF * (2 ** attempt) + random.uniform(0, 1)
+
+# (etag, last_modified, content, encoding) remembered for a revalidated URL
+_Revalidation = Tuple[Optional[str], Optional[str], bytes, Optional[str]]
+
+
+def _replay_response(url: str, entry: _Revalidation) -> requests.Response:
+    """Rebuilds the 200 response a 304 Not Modified refers to from its cached validators and body."""
+    etag, last_modified, content, encoding = entry
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = content
+    response.encoding = encoding
+    if etag:
+        response.headers['ETag'] = etag
+    if last_modified:
+        response.headers['Last-Modified'] = last_modified
+    return response
+
 class PoliteRequester:
     """
     A wrapper around requests to be polite to servers.
@@ -30,19 +124,36 @@ class PoliteRequester:
         }
         self.cookies = {}
 
+        # Keep-alive session so concurrent chapter downloads reuse connections to the host.
+        # Its cookie jar persists: cookies a site sets are sent back on later requests,
+        # alongside (and overridden by) those given to set_cookies.
+        self.session = requests.Session()
+        pool_size = max(10, int(config_manager.get('download_concurrency', 3)))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # {url: entry} for pages fetched with revalidate=True that carried an ETag or Last-Modified,
+        # least recently used first and capped at REVALIDATE_CACHE_BYTES of bodies
+        self._revalidate_cache: "OrderedDict[str, _Revalidation]" = OrderedDict()
+        self._revalidate_cache_bytes = 0
+        self._revalidate_lock = threading.Lock()
+
     def set_cookies(self, cookies: Dict):
         """
         Sets cookies for subsequent requests.
         """
         self.cookies = cookies
 
-    def get(self, url: str, timeout: int = 30) -> requests.Response:
+    def get(self, url: str, timeout: int = 30, revalidate: bool = False) -> requests.Response:
         """
         Sends a GET request to the specified URL with a random delay.
 
         Args:
             url: The URL to fetch.
             timeout: Request timeout in seconds.
+            revalidate: Send If-None-Match/If-Modified-Since for a previously seen
+                response and reuse it when the server answers 304 Not Modified.
 
         Returns:
             requests.Response: The response object.
@@ -50,6 +161,57 @@ class PoliteRequester:
         delay = random.uniform(*self.delay_range)
         time.sleep(delay)
 
-        response = requests.get(url, headers=self.headers, cookies=self.cookies, timeout=timeout)
+        headers = self.headers
+        cached = None
+        if revalidate:
+            with self._revalidate_lock:
+                cached = self._revalidate_cache.get(url)
+            if cached is not None:
+                etag, last_modified, _, _ = cached
+                headers = dict(self.headers)
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+
+        limiter = _limiter_for(url)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            if limiter:
+                limiter.wait()
+            response = self.session.get(url, headers=headers, cookies=self.cookies, timeout=timeout)
+            if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                break
+            retry_delay = _retry_after_seconds(response, attempt)
+            if retry_delay > MAX_RETRY_AFTER:
+                # Don't park a worker thread for hours; raise the 429 below instead
+                break
+            time.sleep(retry_delay)
+
+        if cached is not None and response.status_code == 304:
+            with self._revalidate_lock:
+                if url in self._revalidate_cache:
+                    self._revalidate_cache.move_to_end(url)
+            return _replay_response(url, cached)
+
         response.raise_for_status()
+        if revalidate:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self._remember(url, (etag, last_modified, response.content, response.encoding))
         return response
+
+    def _remember(self, url: str, entry: _Revalidation):
+        """Stores a revalidation entry, evicting the least recently used ones beyond the byte cap."""
+        size = len(entry[2])
+        if size > REVALIDATE_CACHE_BYTES:
+            return
+        with self._revalidate_lock:
+            previous = self._revalidate_cache.pop(url, None)
+            if previous is not None:
+                self._revalidate_cache_bytes -= len(previous[2])
+            self._revalidate_cache[url] = entry
+            self._revalidate_cache_bytes += size
+            while self._revalidate_cache_bytes > REVALIDATE_CACHE_BYTES:
+                _, evicted = self._revalidate_cache.popitem(last=False)
+                self._revalidate_cache_bytes -= len(evicted[2])
@@ -1,4 +1,4 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin, quote
 from typing import List, Dict, Optional
 import re
@@ -7,6 +7,19 @@ from datetime import datetime
 from ..core_logic import BaseSource
 from ..polite_requester import PoliteRequester
 
+# Only the subtrees each entry point reads are built; AO3 pages carry large
+# navigation, comment and kudos blocks that would otherwise be parsed too.
+# Class rules are word-boundary regexes: while parsing, the strainer sees the
+# raw class string ("preface group"), not the split class list.
+# Work preface (title, byline, summary) and the dl.work.meta tag block
+_METADATA_STRAINER = SoupStrainer(['div', 'dl'], class_=re.compile(r'\b(?:preface|meta)\b'))
+# ol.chapter.index on the navigate page
+_NAVIGATE_STRAINER = SoupStrainer('ol', class_=re.compile(r'\bchapter\b'))
+# div#chapters on a chapter page
+_CHAPTERS_STRAINER = SoupStrainer('div', id='chapters')
+# li.work.blurb search results
+_SEARCH_STRAINER = SoupStrainer('li', class_=re.compile(r'\bblurb\b'))
+
 class AO3Source(BaseSource):
     BASE_URL = "https://archiveofourown.org"
     key = "ao3"
@@ -20,10 +33,14 @@ class AO3Source(BaseSource):
 
     def get_metadata(self, url: str) -> Dict:
         response = self.requester.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'lxml', parse_only=_METADATA_STRAINER)
 
         # Title
         title_tag = soup.select_one('h2.title.heading')
+        if not title_tag:
+            # Title outside the usual preface layout: parse the whole page
+            soup = BeautifulSoup(response.text, 'lxml')
+            title_tag = soup.select_one('h2.title.heading')
         title = title_tag.get_text(strip=True) if title_tag else "Unknown Title"
 
         # Author
@@ -109,8 +126,8 @@ class AO3Source(BaseSource):
         # PoliteRequester raises error on bad status, but redirect to login is usually 302 then 200.
         # But we assume public works for now.
 
-        response = self.requester.get(navigate_url)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = self.requester.get(navigate_url, revalidate=True)
+        soup = BeautifulSoup(response.text, 'lxml', parse_only=_NAVIGATE_STRAINER)
 
         chapters = []
         # AO3 navigate page lists chapters in an ordered list
@@ -169,7 +186,7 @@ class AO3Source(BaseSource):
 
     def get_chapter_content(self, chapter_url: str) -> str:
         response = self.requester.get(chapter_url)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'lxml', parse_only=_CHAPTERS_STRAINER)
 
         # Content is usually in <div id="chapters" class="userstuff">
         # Or <div class="userstuff"> inside a chapter container.
@@ -181,6 +198,8 @@ class AO3Source(BaseSource):
         if not content_div:
              content_div = soup.select_one('div#chapters')
         if not content_div:
+            # No #chapters container: parse the whole page for any userstuff block
+            soup = BeautifulSoup(response.text, 'lxml')
             content_div = soup.select_one('div.userstuff')
 
         if content_div:
@@ -237,7 +256,7 @@ class AO3Source(BaseSource):
                     print(f"AO3 Search blocked (Status {e.response.status_code}). Check cookies.")
             return []
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'lxml', parse_only=_SEARCH_STRAINER)
 
         results = []
         for item in soup.select('li.work.blurb'):
@@ -268,3 +287,6 @@ class AO3Source(BaseSource):
             })
 
         return results
+
+# Providers registered by StoryManager.reload_providers
+PROVIDERS = [AO3Source]
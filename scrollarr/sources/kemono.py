@@ -500,3 +500,6 @@ class KemonoSource(BaseSource):
                 browser.close()
 
         return results
+
+# Providers registered by StoryManager.reload_providers
+PROVIDERS = [KemonoSource]
@@ -255,3 +255,6 @@ class QuestionableQuestingAllPostsSource(QuestionableQuestingSource):
                 next_url = None
 
         return chapters
+
+# Providers registered by StoryManager.reload_providers
+PROVIDERS = [QuestionableQuestingSource, QuestionableQuestingAllPostsSource]
@@ -19,7 +19,8 @@ class RoyalRoadSource(BaseSource):
         return 'royalroad.com' in url
 
     def get_metadata(self, url: str) -> Dict:
-        response = self.requester.get(url)
+        # Same page as the chapter list, so the second fetch of a check can come back 304
+        response = self.requester.get(url, revalidate=True)
         soup = BeautifulSoup(response.text, 'html.parser')
 
         title_tag = soup.find('h1')
@@ -91,7 +92,7 @@ class RoyalRoadSource(BaseSource):
         }
 
     def get_chapter_list(self, url: str, **kwargs) -> List[Dict]:
-        response = self.requester.get(url)
+        response = self.requester.get(url, revalidate=True)
         soup = BeautifulSoup(response.text, 'html.parser')
 
         chapters = []
@@ -212,3 +213,6 @@ class RoyalRoadSource(BaseSource):
             })
 
         return results
+
+# Providers registered by StoryManager.reload_providers
+PROVIDERS = [RoyalRoadSource]
@@ -275,3 +275,6 @@ class ScribbleHubSource(BaseSource):
             })
 
         return results
+
+# Providers registered by StoryManager.reload_providers
+PROVIDERS = [ScribbleHubSource]
@@ -20,3 +20,6 @@ class SpaceBattlesSource(XenForoSource):
         if match:
             return match.group(1) + '/'
         return url
+
+# Providers registered by StoryManager.reload_providers
+PROVIDERS = [SpaceBattlesSource]
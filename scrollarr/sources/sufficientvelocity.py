@@ -20,3 +20,6 @@ class SufficientVelocitySource(XenForoSource):
         if match:
             return match.group(1) + '/'
         return url
+
+# Providers registered by StoryManager.reload_providers
+PROVIDERS = [SufficientVelocitySource]
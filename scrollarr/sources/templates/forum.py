@@ -115,7 +115,7 @@ class XenForoSource(BaseSource):
         current_page = start_page
 
         while next_url:
-            response = self.requester.get(next_url)
+            response = self.requester.get(next_url, revalidate=True)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             # Parse chapters
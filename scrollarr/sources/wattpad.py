@@ -302,3 +302,6 @@ class WattpadSource(BaseSource):
                 browser.close()
 
         return results
+
+# Providers registered by StoryManager.reload_providers
+PROVIDERS = [WattpadSource]
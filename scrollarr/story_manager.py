@@ -1,29 +1,414 @@
 import os
+import sys
 import logging
 import json
+import math
+import threading
 import pkgutil
 import importlib
-import inspect
+from collections import defaultdict
+from contextlib import contextmanager
+from itertools import groupby, zip_longest
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from typing import Optional, List, Dict
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, object_session, raiseload, selectinload
+from sqlalchemy import String, bindparam, case, select, type_coerce, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.sql import func
 from .core_logic import SourceManager, BaseSource
-from .database import Story, Chapter, Source, SessionLocal, init_db, engine, DownloadHistory
+from .database import Story, Chapter, Source, SessionLocal, init_db, engine, DownloadHistory, begin_write_transaction
 from .config import config_manager
 from .notifications import NotificationManager
 from .library_manager import LibraryManager
 import os
 import shutil
-import glob
 from pathlib import Path
 import hashlib
+from urllib.parse import urlparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import html as lxml_html
+
+# orjson is optional; it serializes metadata files much faster than the stdlib encoder
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Number of stories merged per commit in update_library
+LIBRARY_UPDATE_BATCH_SIZE = 20
+
+# Maximum number of stories fetched from their sources concurrently in update_library
+LIBRARY_FETCH_WORKERS = 8
+
+# Of those, the most that may hit the same provider at once; browser-driven sources
+# (kemono, wattpad) bypass PoliteRequester's host limits, so this is their only cap
+LIBRARY_FETCH_PER_PROVIDER = 2
+
+# Maximum number of images fetched concurrently per chapter
+IMAGE_DOWNLOAD_WORKERS = 8
+
+# Maximum number of legacy directories removed concurrently in delete_story
+LEGACY_DELETE_WORKERS = 4
+
+# Downloaded chapters recorded per commit in download_missing_chapters
+DOWNLOAD_COMMIT_BATCH_SIZE = 10
+
+# Maximum number of providers searched concurrently, and the overall search deadline in seconds
+SEARCH_WORKERS = 16
+SEARCH_TIMEOUT = 30
+
+def _fast_rmtree(path: str) -> bool:
+    """
+    Removes a directory tree, logging failures instead of raising.
+    Safe to run from worker threads: unlink/getdents release the GIL.
+
+    On platforms where shutil.rmtree.avoids_symlink_attacks is True (Linux and
+    other systems with openat/unlinkat), shutil already walks the tree with
+    os.scandir(fd) and os.unlink(name, dir_fd=fd), so no per-entry path
+    resolution happens and no hand-rolled fd walker is needed.
+    """
+    try:
+        shutil.rmtree(path)
+        logger.info(f"Deleted legacy directory: {path}")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to delete legacy directory {path}: {e}")
+        return False
+
+# Provider metadata keys and the Story attributes they populate
+_STORY_METADATA_FIELDS = (
+    ('title', 'title'),
+    ('author', 'author'),
+    ('cover_url', 'cover_path'),
+    ('description', 'description'),
+    ('tags', 'tags'),
+    ('rating', 'rating'),
+    ('language', 'language'),
+    ('publication_status', 'publication_status'),
+)
+
+def _dump_metadata(data: dict) -> bytes:
+    """
+    Serializes metadata.json content. Both encoders produce the same 2-space,
+    non-ASCII-preserving layout, so the file does not depend on which one is installed.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _set_if_changed(obj, attr: str, value) -> bool:
+    """
+    Assigns obj.attr = value only when it differs from the current value, so
+    unchanged objects stay out of session.dirty and skip their UPDATE.
+    An unloaded (deferred or expired) attribute is loaded for the comparison.
+    Returns True if the attribute was assigned.
+    """
+    if getattr(obj, attr) == value:
+        return False
+    setattr(obj, attr, value)
+    return True
+
+def _apply_story_metadata(story, metadata: dict) -> bool:
+    """
+    Copies provider metadata onto a Story, skipping keys the provider did not
+    return and values that did not change. Returns True if anything was assigned.
+    """
+    changed = False
+    for key, attr in _STORY_METADATA_FIELDS:
+        if key in metadata and _set_if_changed(story, attr, metadata[key]):
+            changed = True
+    return changed
+
+# Provider classes found per source module: {module_name: [BaseSource subclasses]}
+_provider_class_cache: Dict[str, list] = {}
+
+# Subpackages of scrollarr.sources that hold base classes rather than providers
+_SKIPPED_PROVIDER_MODULES = frozenset({'templates'})
+
+def _cached_import(name: str):
+    """
+    Returns the module from sys.modules when already imported,
+    avoiding the import machinery (and its lock) on every provider reload.
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+    return module
+
+def _source_subclasses() -> list:
+    """
+    Returns every BaseSource subclass created so far, including indirect ones
+    such as the XenForo forum sources, by walking the interpreter's own
+    __subclasses__ registry instead of scanning module attributes.
+    """
+    found = []
+    stack = list(BaseSource.__subclasses__())
+    while stack:
+        cls = stack.pop()
+        found.append(cls)
+        stack.extend(cls.__subclasses__())
+    return found
+
+def _providers_signature(module_names: list, sources: list) -> tuple:
+    """
+    Identifies what reload_providers builds from: the provider module names and
+    each Source row's key, enabled flag and config.
+    """
+    return (
+        tuple(module_names),
+        tuple(sorted((s.key, bool(s.is_enabled), s.config or '') for s in sources))
+    )
+
+def _get_provider_classes(module) -> list:
+    """
+    Returns the BaseSource subclasses defined in the given module.
+    Modules declare them in a module-level PROVIDERS list; modules without one
+    fall back to the BaseSource subclass registry. Either way the result is cached per module.
+    """
+    classes = _provider_class_cache.get(module.__name__)
+    if classes is None:
+        classes = getattr(module, 'PROVIDERS', None)
+    if classes is None:
+        # Skip classes imported into (not defined in) this module
+        classes = [cls for cls in _source_subclasses() if cls.__module__ == module.__name__]
+    _provider_class_cache[module.__name__] = classes
+    return classes
+
+def _parse_chapter_html(content: str):
+    """
+    Parses chapter HTML with lxml's C parser.
+    Returns (leading_text, roots). Fragments are parsed as fragments so that
+    serializing them back does not wrap the chapter in <html>/<body>.
+    """
+    head = content.lstrip()[:9].lower()
+    if head.startswith('<!doctype') or head.startswith('<html'):
+        root = lxml_html.document_fromstring(content)
+        # Only keep a doctype the source actually had; lxml invents one otherwise
+        doctype = root.getroottree().docinfo.doctype if head.startswith('<!doctype') else ''
+        return (doctype + '\n' if doctype else ''), [root]
+    roots = lxml_html.fragments_fromstring(content)
+    leading_text = ''
+    if roots and isinstance(roots[0], str):
+        leading_text = roots.pop(0)
+    return leading_text, roots
+
+
+def _serialize_chapter_html(leading_text: str, roots: list) -> str:
+    """Serializes the output of _parse_chapter_html back to a string."""
+    return leading_text + ''.join(lxml_html.tostring(root, encoding='unicode') for root in roots)
+
+
+def _new_chapter_row(story_id, title, source_url, index, published_date,
+                     volume_title, volume_number, tags) -> dict:
+    """
+    Builds a row for a bulk INSERT into the chapters table.
+    Every row carries the same keys so the batch executes as one executemany.
+    """
+    return {
+        'story_id': story_id,
+        'title': title,
+        'source_url': source_url,
+        'index': index,
+        'status': 'pending',
+        'is_downloaded': False,
+        'published_date': published_date,
+        'volume_title': volume_title,
+        'volume_number': volume_number,
+        'tags': tags,
+    }
+
+
+def _strict_loads() -> bool:
+    """
+    Whether read paths should add raiseload('*') (config 'strict_orm_loads'),
+    turning an accidental lazy load into an error instead of a query per row.
+    """
+    return bool(config_manager.get('strict_orm_loads', False))
+
+
+# Per-story statements run once per story on every library pass; built once here
+# so each call only binds story_id and hits the compiled-SQL cache directly
+_EXISTING_CHAPTERS_STMT = select(
+    Chapter.id, Chapter.source_url, Chapter.index, Chapter.published_date,
+    Chapter.volume_title, Chapter.volume_number, Chapter.tags
+).where(Chapter.story_id == bindparam('story_id'))
+
+_LAST_CHAPTER_STMT = select(
+    Chapter.source_url, Chapter.title, Chapter.volume_title,
+    Chapter.volume_number, Chapter.index
+).where(Chapter.story_id == bindparam('story_id')).order_by(Chapter.index.desc()).limit(1)
+
+
+# Every chapter of the library in one scan, for update_library's prefetch
+_LIBRARY_CHAPTERS_STMT = select(
+    Chapter.story_id, Chapter.id, Chapter.source_url, Chapter.index, Chapter.published_date,
+    Chapter.volume_title, Chapter.volume_number, Chapter.tags, Chapter.title
+)
+
+
+def _existing_chapters_by_story(session: Session) -> dict:
+    """
+    Returns {story_id: {source_url: row}} for every chapter in the library,
+    read in a single query instead of one query per story.
+    """
+    by_story = defaultdict(dict)
+    for row in session.execute(_LIBRARY_CHAPTERS_STMT):
+        by_story[row.story_id][row.source_url] = row
+    return by_story
+
+
+def _last_chapter_info(row) -> Optional[dict]:
+    """Formats a chapter row as the last_chapter hint passed to get_chapter_list."""
+    if row is None:
+        return None
+    return {
+        'url': row.source_url,
+        'title': row.title,
+        'volume_title': row.volume_title,
+        'volume_number': row.volume_number,
+        'index': row.index
+    }
+
+
+def _existing_chapters_by_url(session: Session, story_id: int) -> dict:
+    """
+    Returns {source_url: row} for the chapters of a story, selecting only the
+    columns the merge compares instead of hydrating Chapter objects.
+    """
+    rows = session.execute(_EXISTING_CHAPTERS_STMT, {'story_id': story_id})
+    return {row.source_url: row for row in rows}
+
+
+def _merge_chapters(remote_chapters: list, existing_by_url: dict, story_id: int) -> tuple:
+    """
+    Merges a provider chapter list into the existing chapters of a story.
+    Returns (new_chapter_rows, chapter_updates): rows to INSERT for chapters not
+    seen before, and {'id': ..., column: value} dicts for existing chapters
+    whose columns changed. See _write_merged_chapters.
+    """
+    new_chapter_rows = []
+    chapter_updates = []
+    append_row = new_chapter_rows.append
+    append_update = chapter_updates.append
+    get_existing = existing_by_url.get
+    # URLs already merged in this pass; providers occasionally list a chapter twice,
+    # and only the first listing counts for both new and existing chapters
+    seen_urls = set()
+    mark_seen = seen_urls.add
+
+    for i, chap_data in enumerate(remote_chapters):
+        get = chap_data.get
+        url = chap_data['url']
+        if url in seen_urls:
+            continue
+        mark_seen(url)
+        published_date = get('published_date')
+        volume_title = get('volume_title')
+        volume_number = get('volume_number', 1)
+        idx = get('index', i + 1)
+
+        tags_list = get('tags')
+        tags_str = ','.join(tags_list) if tags_list else None
+
+        ec = get_existing(url)
+        if ec is None:
+            append_row(_new_chapter_row(
+                story_id, chap_data['title'], url, idx,
+                published_date, volume_title, volume_number, tags_str
+            ))
+            continue
+
+        # Steady-state polls: nothing about this chapter moved
+        if (ec.index == idx and ec.published_date and ec.volume_title == volume_title
+                and ec.volume_number == volume_number and ec.tags == tags_str):
+            continue
+
+        changes = {}
+        # Update date for existing chapters if missing
+        if not ec.published_date and published_date:
+            changes['published_date'] = published_date
+        # Update index
+        if ec.index != idx:
+            changes['index'] = idx
+        # Update volume info
+        if volume_title and ec.volume_title != volume_title:
+            changes['volume_title'] = volume_title
+        if volume_number and ec.volume_number != volume_number:
+            changes['volume_number'] = volume_number
+        # Update tags
+        if tags_str and ec.tags != tags_str:
+            changes['tags'] = tags_str
+
+        if changes:
+            changes['id'] = ec.id
+            append_update(changes)
+
+    return new_chapter_rows, chapter_updates
+
+
+def _write_merged_chapters(session: Session, new_chapter_rows: list, chapter_updates: list):
+    """
+    Writes the output of _merge_chapters: one executemany INSERT that skips
+    chapters already present (unique on story_id + source_url), and one
+    bulk UPDATE by primary key for the changed existing chapters.
+    """
+    if new_chapter_rows:
+        dialect = session.get_bind().dialect.name
+        if dialect == 'sqlite':
+            stmt = sqlite_insert(Chapter.__table__).on_conflict_do_nothing(index_elements=['story_id', 'source_url'])
+        elif dialect == 'postgresql':
+            stmt = pg_insert(Chapter.__table__).on_conflict_do_nothing(index_elements=['story_id', 'source_url'])
+        else:
+            stmt = Chapter.__table__.insert()
+        session.execute(stmt, new_chapter_rows)
+
+    if chapter_updates:
+        session.execute(update(Chapter), chapter_updates)
+
+
+def _sqlite_datetime_isoformat(value: str) -> str:
+    """
+    Renders a DateTime as stored by SQLite ('YYYY-MM-DD HH:MM:SS.ffffff') the way
+    datetime.isoformat() would, which drops the fraction when it is zero.
+    """
+    value = value.replace(' ', 'T', 1)
+    whole, _, fraction = value.partition('.')
+    return value if fraction.strip('0') else whole
+
+
+def _average_interval_seconds(first_date: datetime, last_date: datetime, count: int) -> float:
+    """
+    Mean gap in seconds between `count` sorted release dates.
+    The consecutive gaps telescope, so only the first and last dates matter.
+    """
+    return (last_date - first_date).total_seconds() / (count - 1)
+
+
+@contextmanager
+def session_scope():
+    """
+    Provides a transactional scope around a series of operations.
+    Commits on success, rolls back on error and always closes the session.
+    """
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
 class StoryManager:
     def __init__(self):
         """
@@ -36,14 +421,24 @@ class StoryManager:
         self.source_manager = SourceManager()
         self.notification_manager = NotificationManager()
         self.library_manager = LibraryManager()
+        # Digest of the last metadata.json written per story: {story_id: digest}
+        self._metadata_hashes: Dict[int, bytes] = {}
+        # Source rows and provider modules the registered providers were built from
+        self._providers_signature: Optional[tuple] = None
+        # Pooled HTTP session shared by image downloads so connections are reused
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.2))
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
         self.reload_providers()
         logger.info("StoryManager initialized and providers registered.")
 
     def reload_providers(self):
         """
         Reloads providers from the database and discovers new ones dynamically.
+        Skipped when neither the Source rows nor the provider modules changed
+        since the last successful reload.
         """
-        self.source_manager.clear_providers()
         session = SessionLocal()
 
         try:
@@ -56,45 +451,44 @@ class StoryManager:
 
             package = scrollarr.sources
             # Use pkgutil to iterate modules in the package path
+            module_names = [
+                name for _, name, _ in pkgutil.iter_modules(package.__path__)
+                if name not in _SKIPPED_PROVIDER_MODULES
+            ]
+
+            signature = _providers_signature(module_names, all_sources_db)
+            if signature == self._providers_signature:
+                logger.debug("Sources unchanged; keeping registered providers.")
+                return
+            self._providers_signature = None
+            self.source_manager.clear_providers()
 
             discovered_providers = []
 
-            for _, name, _ in pkgutil.iter_modules(package.__path__):
-                if name == 'templates': # Skip templates directory
-                    continue
-
+            for name in module_names:
                 full_name = f"scrollarr.sources.{name}"
                 try:
-                    module = importlib.import_module(full_name)
-
-                    for attribute_name in dir(module):
-                        attribute = getattr(module, attribute_name)
-
-                        if inspect.isclass(attribute) and issubclass(attribute, BaseSource):
-                            # Skip BaseSource itself
-                            if attribute is BaseSource:
-                                continue
-
-                            # Skip if imported (not defined in this module)
-                            if attribute.__module__ != module.__name__:
-                                continue
-
-                            # Instantiate
-                            try:
-                                provider_instance = attribute()
-                                # Check if it has a key
-                                if not getattr(provider_instance, 'key', None):
-                                    logger.warning(f"Provider {attribute_name} in {name} has no key. Skipping.")
-                                    continue
-
-                                discovered_providers.append(provider_instance)
-                            except Exception as e:
-                                logger.error(f"Failed to instantiate provider {attribute_name}: {e}")
-
+                    module = _cached_import(full_name)
+                    provider_classes = _get_provider_classes(module)
                 except Exception as e:
                     logger.error(f"Failed to import module {name}: {e}")
+                    continue
 
-            registered_count = 0
+                for provider_class in provider_classes:
+                    # Instantiate
+                    try:
+                        provider_instance = provider_class()
+                        # Check if it has a key
+                        if not getattr(provider_instance, 'key', None):
+                            logger.warning(f"Provider {provider_class.__name__} in {name} has no key. Skipping.")
+                            continue
+
+                        discovered_providers.append(provider_instance)
+                    except Exception as e:
+                        logger.error(f"Failed to instantiate provider {provider_class.__name__}: {e}")
+
+            # New Source rows by key, written in a single commit after the loop
+            new_sources = {}
             for provider_instance in discovered_providers:
                 key = provider_instance.key
 
@@ -111,31 +505,48 @@ class StoryManager:
                         except Exception as e:
                             logger.error(f"Failed to load config for {key}: {e}")
                 else:
-                    # New source found! Add to DB.
-                    logger.info(f"New source discovered: {provider_instance.name} ({key})")
-                    is_enabled_default = getattr(provider_instance, 'is_enabled_by_default', True)
-
-                    new_source = Source(
-                        name=provider_instance.name,
-                        key=key,
-                        is_enabled=is_enabled_default
-                    )
-                    session.add(new_source)
+                    if key not in new_sources:
+                        # New source found! Add to DB.
+                        logger.info(f"New source discovered: {provider_instance.name} ({key})")
+                        new_sources[key] = Source(
+                            name=provider_instance.name,
+                            key=key,
+                            is_enabled=getattr(provider_instance, 'is_enabled_by_default', True)
+                        )
                     # Use default enabled state for instance too
-                    provider_instance.is_enabled = is_enabled_default
+                    provider_instance.is_enabled = new_sources[key].is_enabled
 
-                    try:
-                        session.commit()
-                        # Add to our local map to avoid duplicates if iterating multiple times (not the case here)
-                        sources_map[key] = new_source
-                    except Exception as e:
-                        logger.error(f"Failed to save new source {key} to DB: {e}")
-                        session.rollback()
-                        continue
+            # Taken before committing, which may expire the rows; new Source rows count as DB state
+            next_signature = _providers_signature(module_names, all_sources_db + list(new_sources.values()))
+
+            # Keys whose Source row could not be saved; their providers are not registered
+            failed_keys = set()
+            if new_sources:
+                session.add_all(new_sources.values())
+                try:
+                    session.commit()
+                except Exception as e:
+                    logger.error(f"Failed to save new sources in one batch, retrying individually: {e}")
+                    session.rollback()
+                    for key, new_source in new_sources.items():
+                        session.add(new_source)
+                        try:
+                            session.commit()
+                        except Exception as e:
+                            logger.error(f"Failed to save new source {key} to DB: {e}")
+                            session.rollback()
+                            failed_keys.add(key)
 
+            registered_count = 0
+            for provider_instance in discovered_providers:
+                if provider_instance.key in failed_keys:
+                    continue
                 self.source_manager.register_provider(provider_instance)
                 registered_count += 1
 
+            # A failed save leaves no signature so the next call retries
+            if not failed_keys:
+                self._providers_signature = next_signature
             logger.info(f"Reloaded providers. {registered_count} providers registered.")
         except Exception as e:
             logger.error(f"Error reloading providers: {e}")
@@ -143,11 +554,42 @@ class StoryManager:
         finally:
             session.close()
 
+    @contextmanager
+    def _session(self, session: Optional[Session] = None):
+        """
+        Yields the caller's session when one is given, otherwise a fresh one that is closed afterwards.
+        Methods that write still commit or roll back whichever session they get, so passing
+        one saves a session checkout, not a transaction; loops over stories with network I/O
+        in between should let each call open its own.
+        """
+        if session is not None:
+            yield session
+            return
+        # Callers read the story again after committing (metadata.json); keep it loaded
+        session = SessionLocal(expire_on_commit=False)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _resolve_provider(self, story):
+        """
+        Returns the provider for a story: by its stored provider key when set,
+        otherwise by matching its source URL. Both lookups are cached by SourceManager.
+        """
+        provider = None
+        if story.provider_name:
+            provider = self.source_manager.get_provider_by_key(story.provider_name)
+        if not provider:
+            provider = self.source_manager.get_provider_for_url(story.source_url)
+        return provider
+
     def search(self, query: str, provider_key: Optional[str] = None) -> List[Dict]:
         """
         Searches for stories using enabled providers.
+        Providers are queried concurrently; results keep the provider order.
         """
-        results = []
+        providers = []
         for provider in self.source_manager.providers:
             # Check enabled state
             if not getattr(provider, 'is_enabled', True):
@@ -158,13 +600,32 @@ class StoryManager:
             if provider_key and p_key and p_key != provider_key:
                 continue
 
-            try:
-                # Add provider name to results if not present (handled by provider usually)
-                provider_results = provider.search(query)
-                results.extend(provider_results)
-            except Exception as e:
-                logger.error(f"Search failed for provider {p_key}: {e}")
+            providers.append(provider)
+
+        if not providers:
+            return []
+
+        # Provider results by position in `providers`
+        results_by_provider = {}
+        executor = ThreadPoolExecutor(max_workers=min(SEARCH_WORKERS, len(providers)))
+        try:
+            futures = {executor.submit(provider.search, query): i for i, provider in enumerate(providers)}
+            for future in as_completed(futures, timeout=SEARCH_TIMEOUT):
+                p_key = getattr(providers[futures[future]], 'key', None)
+                try:
+                    # Add provider name to results if not present (handled by provider usually)
+                    results_by_provider[futures[future]] = future.result()
+                except Exception as e:
+                    logger.error(f"Search failed for provider {p_key}: {e}")
+        except FuturesTimeoutError:
+            logger.warning(f"Search timed out after {SEARCH_TIMEOUT}s; returning partial results.")
+        finally:
+            # Don't hold the caller on providers that missed the deadline
+            executor.shutdown(wait=False, cancel_futures=True)
 
+        results = []
+        for i in sorted(results_by_provider):
+            results.extend(results_by_provider[i] or [])
         return results
 
     def add_story(self, url: str, profile_id: Optional[int] = None, provider_key: Optional[str] = None) -> int:
@@ -188,7 +649,8 @@ class StoryManager:
         metadata = provider.get_metadata(url)
         chapters_data = provider.get_chapter_list(url)
 
-        session = SessionLocal()
+        # The story is read again after commit for metadata.json
+        session = SessionLocal(expire_on_commit=False)
         try:
             story = session.query(Story).filter(Story.source_url == url).first()
 
@@ -210,65 +672,23 @@ class StoryManager:
                 )
                 session.add(story)
                 session.flush()
+                # A story created just now has no chapters to compare against
+                existing_urls = {}
             else:
                 logger.info("Updating existing story record.")
-                story.title = metadata.get('title', story.title)
-                story.author = metadata.get('author', story.author)
-                story.cover_path = metadata.get('cover_url', story.cover_path)
-                story.description = metadata.get('description', story.description)
-                story.tags = metadata.get('tags', story.tags)
-                story.rating = metadata.get('rating', story.rating)
-                story.language = metadata.get('language', story.language)
-                story.publication_status = metadata.get('publication_status', story.publication_status)
+                _apply_story_metadata(story, metadata)
+                existing_urls = _existing_chapters_by_url(session, story.id)
 
             # Handle chapters
-            existing_urls = {c.source_url: c for c in story.chapters}
-            new_chapters_count = 0
-
-            for i, chapter_data in enumerate(chapters_data):
-                c_url = chapter_data['url']
-                published_date = chapter_data.get('published_date')
-                volume_title = chapter_data.get('volume_title')
-                volume_number = chapter_data.get('volume_number', 1)
-                idx = chapter_data.get('index', i + 1)
-
-                tags_list = chapter_data.get('tags', [])
-                tags_str = ','.join(tags_list) if tags_list else None
-
-                if c_url not in existing_urls:
-                    new_chapter = Chapter(
-                        title=chapter_data['title'],
-                        source_url=c_url,
-                        story_id=story.id,
-                        index=idx,
-                        status='pending',
-                        published_date=published_date,
-                        volume_title=volume_title,
-                        volume_number=volume_number,
-                        tags=tags_str
-                    )
-                    session.add(new_chapter)
-                    new_chapters_count += 1
-                else:
-                    # Update index if needed
-                    existing_chap = existing_urls[c_url]
-                    if existing_chap.index != idx:
-                        existing_chap.index = idx
-                    # Update published_date if missing
-                    if not existing_chap.published_date and published_date:
-                        existing_chap.published_date = published_date
-                    # Update volume info
-                    if volume_title and existing_chap.volume_title != volume_title:
-                         existing_chap.volume_title = volume_title
-                    if volume_number and existing_chap.volume_number != volume_number:
-                         existing_chap.volume_number = volume_number
-                    # Update tags
-                    if tags_str and existing_chap.tags != tags_str:
-                         existing_chap.tags = tags_str
-
-            story.last_checked = func.now()
+            new_chapter_rows, chapter_updates = _merge_chapters(chapters_data, existing_urls, story.id)
+
+            new_chapters_count = len(new_chapter_rows)
+            _write_merged_chapters(session, new_chapter_rows, chapter_updates)
+
+            now = datetime.utcnow()
+            story.last_checked = now
             if new_chapters_count > 0:
-                story.last_updated = func.now()
+                story.last_updated = now
 
             session.commit()
             logger.info(f"Story '{story.title}' processed. Added {new_chapters_count} new chapters.")
@@ -288,15 +708,19 @@ class StoryManager:
     def get_pending_chapters(self):
         """
         Returns all chapters marked as 'pending' across all monitored stories.
+        The session is closed before returning, so the chapters and their stories come back detached.
         """
         session = SessionLocal()
         try:
-            chapters = session.query(Chapter).join(Story).options(joinedload(Chapter.story)).filter(
+            # The join only filters; parents load once via IN instead of widening every row
+            if _strict_loads():
+                loader_options = (selectinload(Chapter.story).raiseload('*'), raiseload('*'))
+            else:
+                loader_options = (selectinload(Chapter.story),)
+            return session.query(Chapter).join(Story).options(*loader_options).filter(
                 Story.is_monitored == True,
                 Chapter.status == 'pending'
             ).all()
-            session.expunge_all()
-            return chapters
         finally:
             session.close()
 
@@ -325,66 +749,81 @@ class StoryManager:
             }
 
             story_path = self.library_manager.get_story_path(story)
-
-            # Add chapters
-            if story.chapters:
-                sorted_chapters = sorted(story.chapters, key=lambda c: c.index if c.index is not None else -1)
-                for chapter in sorted_chapters:
-                    local_path_rel = None
-                    if chapter.local_path:
-                        try:
-                            # Try to make path relative to story folder
-                            abs_path = Path(chapter.local_path).resolve()
-                            story_abs_path = story_path.resolve()
-                            if str(abs_path).startswith(str(story_abs_path)):
-                                local_path_rel = str(abs_path.relative_to(story_abs_path))
-                            else:
-                                local_path_rel = chapter.local_path # Keep absolute if outside
-                        except Exception:
-                            local_path_rel = chapter.local_path
-
-                    story_data['chapters'].append({
-                        'index': chapter.index,
-                        'title': chapter.title,
-                        'url': chapter.source_url,
-                        'status': chapter.status,
-                        'is_downloaded': chapter.is_downloaded,
-                        'local_path': local_path_rel,
-                        'volume_number': chapter.volume_number,
-                        'volume_title': chapter.volume_title,
-                        'published_date': chapter.published_date.isoformat() if chapter.published_date else None,
-                        'tags': chapter.tags
-                    })
+            story_abs_path = story_path.resolve()
+            story_abs_prefix = str(story_abs_path) + os.sep
+
+            def relative_local_path(local_path):
+                if not local_path:
+                    return None
+                # Paths we wrote ourselves are already absolute under the story folder
+                if local_path.startswith(story_abs_prefix):
+                    return local_path[len(story_abs_prefix):]
+                try:
+                    # Try to make path relative to story folder
+                    abs_path = Path(local_path).resolve()
+                    if str(abs_path).startswith(str(story_abs_path)):
+                        return str(abs_path.relative_to(story_abs_path))
+                    return local_path # Keep absolute if outside
+                except Exception:
+                    return local_path
+
+            # Add chapters as plain rows, ordered by the database when the story is attached to a session
+            session = object_session(story)
+            if session is not None:
+                chapter_rows = session.query(
+                    Chapter.index, Chapter.title, Chapter.source_url, Chapter.status,
+                    Chapter.is_downloaded, Chapter.local_path, Chapter.volume_number,
+                    Chapter.volume_title, Chapter.published_date, Chapter.tags
+                ).filter(Chapter.story_id == story.id).order_by(Chapter.index).all()
+            else:
+                chapter_rows = [
+                    (c.index, c.title, c.source_url, c.status, c.is_downloaded, c.local_path,
+                     c.volume_number, c.volume_title, c.published_date, c.tags)
+                    for c in sorted(story.chapters, key=lambda c: c.index if c.index is not None else -1)
+                ]
+
+            story_data['chapters'] = [
+                {
+                    'index': index,
+                    'title': title,
+                    'url': url,
+                    'status': status,
+                    'is_downloaded': is_downloaded,
+                    'local_path': relative_local_path(local_path),
+                    'volume_number': volume_number,
+                    'volume_title': volume_title,
+                    'published_date': published_date.isoformat() if published_date else None,
+                    'tags': tags
+                }
+                for (index, title, url, status, is_downloaded, local_path,
+                     volume_number, volume_title, published_date, tags) in chapter_rows
+            ]
 
             # Get path
             metadata_path = self.library_manager.get_metadata_absolute_path(story)
+
+            # Skip the write when nothing but last_checked changed since we last wrote;
+            # every update pass bumps it, so it is left out of the digest
+            stable_data = {key: value for key, value in story_data.items() if key != 'last_checked'}
+            digest = hashlib.blake2b(_dump_metadata(stable_data), digest_size=16).digest()
+            if self._metadata_hashes.get(story.id) == digest and metadata_path.exists():
+                logger.debug(f"Metadata for story {story.id} unchanged, skipping write")
+                return
+
             self.library_manager.ensure_directories(metadata_path.parent)
 
             # Write file
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(story_data, f, indent=4, ensure_ascii=False)
+            metadata_path.write_bytes(_dump_metadata(story_data))
+            self._metadata_hashes[story.id] = digest
 
             logger.debug(f"Saved metadata for story {story.id} to {metadata_path}")
 
         except Exception as e:
             logger.error(f"Failed to save metadata for story {story.id}: {e}")
 
-    def _get_last_chapter_info(self, story):
+    def _get_last_chapter_info(self, session: Session, story):
         """Helper to extract last chapter info for optimization."""
-        if not story.chapters:
-            return None
-
-        sorted_chapters = sorted(story.chapters, key=lambda c: c.index if c.index is not None else -1, reverse=True)
-        if sorted_chapters:
-            lc = sorted_chapters[0]
-            return {
-                'url': lc.source_url,
-                'title': lc.title,
-                'volume_title': lc.volume_title,
-                'volume_number': lc.volume_number,
-                'index': lc.index
-            }
-        return None
+        return _last_chapter_info(session.execute(_LAST_CHAPTER_STMT, {'story_id': story.id}).first())
 
     def list_stories(self):
         """
@@ -393,19 +832,25 @@ class StoryManager:
         """
         session = SessionLocal()
         try:
-            stories = session.query(Story).all()
-            result = []
-            for story in stories:
-                total = len(story.chapters)
-                downloaded = sum(1 for c in story.chapters if c.is_downloaded)
-                result.append({
-                    'id': story.id,
-                    'title': story.title,
-                    'author': story.author,
+            # Aggregate chapter counts in SQL instead of loading every story's chapters
+            rows = session.query(
+                Story.id,
+                Story.title,
+                Story.author,
+                func.count(Chapter.id),
+                func.coalesce(func.sum(case((Chapter.is_downloaded == True, 1), else_=0)), 0)
+            ).outerjoin(Chapter, Chapter.story_id == Story.id).group_by(Story.id).all()
+
+            return [
+                {
+                    'id': story_id,
+                    'title': title,
+                    'author': author,
                     'downloaded': downloaded,
                     'total': total
-                })
-            return result
+                }
+                for story_id, title, author, total, downloaded in rows
+            ]
         finally:
             session.close()
 
@@ -425,114 +870,146 @@ class StoryManager:
         For each story, fetches the current list of chapters from the web.
         Compares the web list to the database list.
         Creates a new Chapter record with status='pending' for any URL that does not exist in the database.
+        Fetched stories are merged in batches of LIBRARY_UPDATE_BATCH_SIZE, each batch in one
+        short write transaction opened after its fetches completed; each story merges inside
+        its own savepoint so a failing story does not discard the batch.
         """
         logger.info("Starting library update...")
-        session = SessionLocal()
+        # commit_pending notifies and writes metadata.json from the stories it just committed
+        session = SessionLocal(expire_on_commit=False)
+        # Single timestamp for the whole pass; a bound value lets UPDATEs batch
+        now = datetime.utcnow()
+        # Stories fetched but not merged yet, as (story, existing_by_url, metadata, remote_chapters)
+        fetched = []
+        # Stories merged since the last commit, as (story, new_chapters_count)
+        pending = []
+
+        def merge_fetched():
+            # Network I/O is over for these stories; hold the write lock only while merging them
+            begin_write_transaction(session)
+            for story, existing_by_url, metadata, remote_chapters in fetched:
+                try:
+                    # One savepoint per story: a failure rolls back this story only,
+                    # the rest of the batch stays in the outer transaction
+                    with session.begin_nested():
+                        # Update story metadata
+                        if metadata:
+                            _apply_story_metadata(story, metadata)
+
+                        new_chapter_rows, chapter_updates = _merge_chapters(remote_chapters, existing_by_url, story.id)
+                        _write_merged_chapters(session, new_chapter_rows, chapter_updates)
+                except Exception as e:
+                    logger.error(f"Error updating story '{story.title}': {e}")
+                    continue
+
+                new_chapters_count = len(new_chapter_rows)
+                if new_chapters_count > 0:
+                    logger.info(f"Found {new_chapters_count} new chapters for '{story.title}'")
+                else:
+                    logger.info(f"No new chapters for '{story.title}'")
+                pending.append((story, new_chapters_count))
+            fetched.clear()
+
+            if not pending:
+                session.rollback()
+                return
+            try:
+                commit_pending()
+            except Exception as e:
+                logger.error(f"Error committing library update batch: {e}")
+                session.rollback()
+                logger.warning(f"Discarded {len(pending)} uncommitted story updates after rollback.")
+                pending.clear()
+
+        def commit_pending():
+            # Stamp the whole batch with two UPDATEs instead of one per story
+            checked_ids = [story.id for story, _ in pending]
+            updated_ids = [story.id for story, new_chapters_count in pending if new_chapters_count > 0]
+            session.execute(update(Story).where(Story.id.in_(checked_ids)).values(last_checked=now))
+            if updated_ids:
+                session.execute(update(Story).where(Story.id.in_(updated_ids)).values(last_updated=now))
+            session.commit()
+            for story, new_chapters_count in pending:
+                if new_chapters_count > 0:
+                    # Notify
+                    self.notification_manager.dispatch('on_new_chapters', {
+                        'story_title': story.title,
+                        'new_chapters_count': new_chapters_count,
+                        'story_id': story.id
+                    })
+
+                # Save metadata
+                self.save_metadata(story)
+            pending.clear()
+
         try:
             # Iterate through all stories
-            stories = session.query(Story).all()
+            # Full rows: metadata merging and save_metadata read every column.
+            # Chapters are queried explicitly below.
+            stories = session.query(Story).options(
+                raiseload('*') if _strict_loads() else raiseload(Story.chapters)
+            ).all()
+            # Existing chapters for every story in one scan rather than two queries per story
+            existing_by_story = _existing_chapters_by_story(session)
 
+            # Resolve providers and last chapters up front, grouped by provider
+            fetches_by_provider = defaultdict(list)
+            provider_slots = {}
             for story in stories:
                 try:
                     logger.info(f"Checking updates for story: {story.title}")
 
-                    provider = None
-                    if story.provider_name:
-                        provider = self.source_manager.get_provider_by_key(story.provider_name)
-
-                    if not provider:
-                        provider = self.source_manager.get_provider_for_url(story.source_url)
+                    provider = self._resolve_provider(story)
 
                     if not provider:
                         logger.warning(f"No provider found for story: {story.title} ({story.source_url})")
                         continue
 
-                    # Fetch metadata and update story
-                    try:
-                        metadata = provider.get_metadata(story.source_url)
-                        story.title = metadata.get('title', story.title)
-                        story.author = metadata.get('author', story.author)
-                        story.cover_path = metadata.get('cover_url', story.cover_path)
-                        story.description = metadata.get('description', story.description)
-                        story.tags = metadata.get('tags', story.tags)
-                        story.rating = metadata.get('rating', story.rating)
-                        story.language = metadata.get('language', story.language)
-                        story.publication_status = metadata.get('publication_status', story.publication_status)
-                    except Exception as meta_err:
-                        logger.warning(f"Failed to update metadata for {story.title}: {meta_err}")
-
                     # Determine last chapter for optimization
-                    last_chapter = self._get_last_chapter_info(story)
-
-                    # Fetch current chapters from source
-                    remote_chapters = provider.get_chapter_list(story.source_url, last_chapter=last_chapter)
-
-                    # Get existing chapters from DB
-                    existing_chapter_urls = {c.source_url for c in story.chapters}
-
-                    new_chapters_count = 0
-                    for i, chap_data in enumerate(remote_chapters):
-                        published_date = chap_data.get('published_date')
-                        volume_title = chap_data.get('volume_title')
-                        volume_number = chap_data.get('volume_number', 1)
-                        idx = chap_data.get('index', i + 1)
-
-                        tags_list = chap_data.get('tags', [])
-                        tags_str = ','.join(tags_list) if tags_list else None
-
-                        if chap_data['url'] not in existing_chapter_urls:
-                            new_chapter = Chapter(
-                                title=chap_data['title'],
-                                source_url=chap_data['url'],
-                                story_id=story.id,
-                                index=idx,
-                                status='pending',
-                                published_date=published_date,
-                                volume_title=volume_title,
-                                volume_number=volume_number,
-                                tags=tags_str
-                            )
-                            session.add(new_chapter)
-                            new_chapters_count += 1
-                        else:
-                             # Update date for existing chapters if missing
-                             for ec in story.chapters:
-                                 if ec.source_url == chap_data['url']:
-                                     if not ec.published_date and published_date:
-                                         ec.published_date = published_date
-                                     # Update index
-                                     if ec.index != idx:
-                                         ec.index = idx
-                                     if volume_title and ec.volume_title != volume_title:
-                                         ec.volume_title = volume_title
-                                     if volume_number and ec.volume_number != volume_number:
-                                         ec.volume_number = volume_number
-                                     if tags_str and ec.tags != tags_str:
-                                         ec.tags = tags_str
-                                     break
-
-                    story.last_checked = func.now()
-                    if new_chapters_count > 0:
-                        story.last_updated = func.now()
-                        logger.info(f"Found {new_chapters_count} new chapters for '{story.title}'")
-
-                        # Notify
-                        self.notification_manager.dispatch('on_new_chapters', {
-                            'story_title': story.title,
-                            'new_chapters_count': new_chapters_count,
-                            'story_id': story.id
-                        })
-                    else:
-                        logger.info(f"No new chapters for '{story.title}'")
+                    # (highest index; chapters without one only when nothing is numbered,
+                    # matching the ORDER BY index DESC used by _get_last_chapter_info)
+                    existing_by_url = existing_by_story.pop(story.id, {})
+                    last_chapter = _last_chapter_info(max(
+                        existing_by_url.values(),
+                        key=lambda row: (row.index is not None, row.index or 0),
+                        default=None
+                    ))
+                except Exception as e:
+                    logger.error(f"Error updating story '{story.title}': {e}")
+                    continue
 
-                    session.commit()
+                slot = provider_slots.get(id(provider))
+                if slot is None:
+                    slot = provider_slots[id(provider)] = threading.BoundedSemaphore(LIBRARY_FETCH_PER_PROVIDER)
+                fetches_by_provider[id(provider)].append((story, provider, slot, existing_by_url, last_chapter))
 
-                    # Save metadata
-                    self.save_metadata(story)
+            # Interleave providers so workers waiting on one provider's limit don't hold up the others
+            fetches = [fetch for round_ in zip_longest(*fetches_by_provider.values()) for fetch in round_ if fetch]
 
-                except Exception as e:
-                    logger.error(f"Error updating story '{story.title}': {e}")
-                    session.rollback()
+            # Network fetches run on a thread pool; merging and all session work stay on this thread
+            workers = max(1, min(LIBRARY_FETCH_WORKERS, len(fetches)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                jobs = {}
+                for story, provider, slot, existing_by_url, last_chapter in fetches:
+                    future = executor.submit(self._fetch_story_updates, provider, story.source_url, story.title, last_chapter, slot)
+                    jobs[future] = (story, existing_by_url)
+
+                for future in as_completed(jobs):
+                    story, existing_by_url = jobs.pop(future)
+                    try:
+                        # Everything came from the source before touching the session,
+                        # so a network failure leaves nothing to roll back
+                        metadata, remote_chapters = future.result()
+                    except Exception as e:
+                        logger.error(f"Error updating story '{story.title}': {e}")
+                        continue
+
+                    fetched.append((story, existing_by_url, metadata, remote_chapters))
+                    if len(fetched) >= LIBRARY_UPDATE_BATCH_SIZE:
+                        merge_fetched()
+
+            if fetched:
+                merge_fetched()
 
             logger.info("Library update completed.")
 
@@ -541,11 +1018,31 @@ class StoryManager:
         finally:
             session.close()
 
+    def _fetch_story_updates(self, provider, source_url: str, title: str, last_chapter: Optional[dict],
+                             slot: threading.BoundedSemaphore) -> tuple:
+        """
+        Fetches a story's metadata and chapter list from its source.
+        Runs on update_library's worker threads, so it must not touch ORM state.
+        Holds the provider's slot for the duration, capping concurrent fetches per source.
+        Returns (metadata or None, remote_chapters); a metadata failure is logged and tolerated.
+        """
+        with slot:
+            metadata = None
+            try:
+                metadata = provider.get_metadata(source_url)
+            except Exception as meta_err:
+                logger.warning(f"Failed to update metadata for {title}: {meta_err}")
+
+            # Fetch current chapters from source
+            remote_chapters = provider.get_chapter_list(source_url, last_chapter=last_chapter)
+            return metadata, remote_chapters
+
     def download_missing_chapters(self, story_id: int):
         """
         Downloads content for all chapters of the story that are not yet downloaded.
         """
-        session = SessionLocal()
+        # The story is read again after the final commit for metadata.json
+        session = SessionLocal(expire_on_commit=False)
         try:
             story = session.query(Story).filter(Story.id == story_id).first()
             if not story:
@@ -569,31 +1066,41 @@ class StoryManager:
 
             logger.info(f"Found {len(missing_chapters)} chapters to download.")
 
-            for chapter in missing_chapters:
-                logger.info(f"Downloading chapter: {chapter.title}")
-                try:
-                    content = provider.get_chapter_content(chapter.source_url)
-
-                    # Determine path using LibraryManager
-                    filepath = self.library_manager.get_chapter_absolute_path(story, chapter)
-                    self.library_manager.ensure_directories(filepath.parent)
-
-                    # Process images
-                    content = self._process_chapter_images(content, story, filepath)
+            # Workers only see plain values; ORM objects stay on this thread
+            images_dir = self.library_manager.get_images_dir(story)
+            jobs = [
+                (chapter, chapter.title, chapter.source_url, self.library_manager.get_chapter_absolute_path(story, chapter))
+                for chapter in missing_chapters
+            ]
 
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(content)
+            # Chapters share a handful of folders (one per volume); create each once up front
+            for directory in {filepath.parent for *_, filepath in jobs}:
+                self.library_manager.ensure_directories(directory)
 
-                    chapter.local_path = str(filepath)
-                    chapter.is_downloaded = True
-                    chapter.status = 'downloaded'
-                    session.commit() # Commit after each chapter to save progress
+            workers = max(1, min(int(config_manager.get('download_concurrency', 3)), len(jobs)))
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {}
+                    for chapter, title, source_url, filepath in jobs:
+                        future = executor.submit(self._fetch_chapter, provider, title, source_url, story_id, images_dir, filepath)
+                        futures[future] = (chapter, title)
+
+                    for done, future in enumerate(as_completed(futures), 1):
+                        chapter, title = futures[future]
+                        try:
+                            chapter.local_path = future.result()
+                            chapter.is_downloaded = True
+                            chapter.status = 'downloaded'
+                        except Exception as e:
+                            logger.error(f"Failed to download chapter {title}: {e}")
+                            chapter.status = 'failed'
 
-                except Exception as e:
-                    logger.error(f"Failed to download chapter {chapter.title}: {e}")
-                    chapter.status = 'failed'
-                    session.commit()
-                    # Optionally continue to next chapter or break
+                        # Commit periodically to save progress
+                        if done % DOWNLOAD_COMMIT_BATCH_SIZE == 0:
+                            session.commit()
+            finally:
+                # Keep whatever finished since the last periodic commit, even if the loop was interrupted
+                session.commit()
 
             # Save metadata
             self.save_metadata(story)
@@ -601,62 +1108,96 @@ class StoryManager:
         finally:
             session.close()
 
-    def _process_chapter_images(self, content: str, story: Story, chapter_path: Path) -> str:
+    def _fetch_chapter(self, provider, title: str, source_url: str, story_id: int, images_dir: Path, filepath: Path) -> str:
+        """
+        Fetches one chapter, localizes its images into images_dir and writes it to filepath,
+        whose folder the caller has already created.
+        Runs on download worker threads, so it must not touch ORM state.
+        Returns the written path.
+        """
+        logger.info(f"Downloading chapter: {title}")
+        content = provider.get_chapter_content(source_url)
+
+        # Process images
+        content = self._process_chapter_images(content, story_id, images_dir, filepath)
+
+        # Encode once and write bytes; skips the text layer's incremental encoder
+        with open(filepath, 'wb') as f:
+            f.write(content.encode('utf-8'))
+        return str(filepath)
+
+    def _download_image(self, src: str, local_img_path: Path) -> bool:
+        """
+        Downloads a single image through the shared HTTP session.
+        Returns True if the file was written.
+        """
+        try:
+            img_resp = self._http.get(src, timeout=10, headers={'User-Agent': 'Mozilla/5.0'})
+            if img_resp.status_code == 200:
+                with open(local_img_path, 'wb') as f:
+                    f.write(img_resp.content)
+                logger.debug(f"Downloaded image {local_img_path.name}")
+                return True
+            logger.warning(f"Failed to download image {src}: Status {img_resp.status_code}")
+        except Exception as img_err:
+            logger.warning(f"Error downloading image {src}: {img_err}")
+        return False
+
+    def _process_chapter_images(self, content: str, story_id: int, images_dir: Path, chapter_path: Path) -> str:
         """
         Internal method to find, download, and update images in chapter content.
+        Missing images are fetched concurrently over a pooled HTTP session.
         """
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            images = soup.find_all('img')
+            leading_text, roots = _parse_chapter_html(content)
+            images = [img for root in roots for img in root.iter('img')]
             if images:
-                images_dir = self.library_manager.get_images_dir(story)
                 self.library_manager.ensure_directories(images_dir)
 
-                modified = False
+                # (img tag, original src, local path) for every remote image
+                targets = []
+                # Images still to fetch: {local path: src}
+                to_download = {}
                 for img in images:
                     src = img.get('src')
                     if not src or not src.startswith('http'):
                         continue
 
                     # Generate filename
-                    ext = 'jpg'
-                    if '.' in src.split('/')[-1]:
-                        ext_cand = src.split('/')[-1].split('.')[-1].split('?')[0]
-                        if len(ext_cand) <= 4 and ext_cand.isalnum():
-                            ext = ext_cand
+                    ext = os.path.splitext(urlparse(src).path)[1][1:]
+                    if not (ext and len(ext) <= 4 and ext.isalnum()):
+                        ext = 'jpg'
 
-                    filename = f"img_{story.id}_{hashlib.md5(src.encode()).hexdigest()[:10]}.{ext}"
+                    filename = f"img_{story_id}_{hashlib.blake2b(src.encode(), digest_size=5).hexdigest()}.{ext}"
                     local_img_path = images_dir / filename
+                    targets.append((img, src, local_img_path))
 
-                    if not local_img_path.exists():
-                        try:
-                            # Simple download
-                            img_resp = requests.get(src, timeout=10, headers={'User-Agent': 'Mozilla/5.0'})
-                            if img_resp.status_code == 200:
-                                with open(local_img_path, 'wb') as f:
-                                    f.write(img_resp.content)
-                                logger.debug(f"Downloaded image {filename}")
-                            else:
-                                logger.warning(f"Failed to download image {src}: Status {img_resp.status_code}")
-                        except Exception as img_err:
-                            logger.warning(f"Error downloading image {src}: {img_err}")
+                    if local_img_path not in to_download and not local_img_path.exists():
+                        to_download[local_img_path] = src
+
+                if to_download:
+                    workers = min(IMAGE_DOWNLOAD_WORKERS, len(to_download))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        list(executor.map(self._download_image, to_download.values(), to_download.keys()))
 
+                modified = False
+                for img, src, local_img_path in targets:
                     if local_img_path.exists():
                         # Update src to relative path
                         try:
                             rel_path = os.path.relpath(local_img_path, chapter_path.parent)
                             # Store original src for reference/debugging/safety
-                            img['data-original-src'] = src
+                            img.set('data-original-src', src)
                             # Ensure forward slashes for HTML
-                            img['src'] = rel_path.replace(os.sep, '/')
+                            img.set('src', rel_path.replace(os.sep, '/'))
                             modified = True
                         except ValueError:
                             pass
 
                 if modified:
-                    return str(soup)
-        except Exception as soup_err:
-            logger.error(f"Error processing images for chapter: {soup_err}")
+                    return _serialize_chapter_html(leading_text, roots)
+        except Exception as parse_err:
+            logger.error(f"Error processing images for chapter: {parse_err}")
 
         return content
 
@@ -677,6 +1218,7 @@ class StoryManager:
                 Chapter.is_downloaded == True
             ).all()
 
+            images_dir = self.library_manager.get_images_dir(story)
             updated_count = 0
             for chapter in chapters:
                 if not chapter.local_path or not os.path.exists(chapter.local_path):
@@ -686,11 +1228,11 @@ class StoryManager:
                     with open(chapter.local_path, 'r', encoding='utf-8') as f:
                         content = f.read()
 
-                    new_content = self._process_chapter_images(content, story, Path(chapter.local_path))
+                    new_content = self._process_chapter_images(content, story.id, images_dir, Path(chapter.local_path))
 
                     if content != new_content:
-                        with open(chapter.local_path, 'w', encoding='utf-8') as f:
-                            f.write(new_content)
+                        with open(chapter.local_path, 'wb') as f:
+                            f.write(new_content.encode('utf-8'))
                         updated_count += 1
                 except Exception as e:
                     logger.error(f"Error scanning images for chapter {chapter.title}: {e}")
@@ -707,14 +1249,7 @@ class StoryManager:
         """
         try:
             metadata = provider.get_metadata(story.source_url)
-            story.title = metadata.get('title', story.title)
-            story.author = metadata.get('author', story.author)
-            story.cover_path = metadata.get('cover_url', story.cover_path)
-            story.description = metadata.get('description', story.description)
-            story.tags = metadata.get('tags', story.tags)
-            story.rating = metadata.get('rating', story.rating)
-            story.language = metadata.get('language', story.language)
-            story.publication_status = metadata.get('publication_status', story.publication_status)
+            _apply_story_metadata(story, metadata)
         except Exception as meta_err:
             logger.warning(f"Failed to update metadata for {story.title}: {meta_err}")
 
@@ -726,7 +1261,10 @@ class StoryManager:
         session = SessionLocal()
         try:
             # Check for missing description as a proxy for missing metadata
-            stories = session.query(Story).filter(
+            query = session.query(Story)
+            if _strict_loads():
+                query = query.options(raiseload('*'))
+            stories = query.filter(
                 (Story.description == None) | (Story.description == "")
             ).all()
 
@@ -736,19 +1274,24 @@ class StoryManager:
 
             logger.info(f"Found {len(stories)} stories with missing metadata.")
 
+            # Resolve each stored provider key once; stories without one (or with
+            # an unknown key) fall back to the URL lookup, which SourceManager caches
+            stories_by_provider = defaultdict(list)
             for story in stories:
-                provider = None
-                if story.provider_name:
-                    provider = self.source_manager.get_provider_by_key(story.provider_name)
-                if not provider:
-                    provider = self.source_manager.get_provider_for_url(story.source_url)
+                stories_by_provider[story.provider_name].append(story)
+
+            for provider_name, group in stories_by_provider.items():
+                keyed_provider = self.source_manager.get_provider_by_key(provider_name) if provider_name else None
 
-                if provider:
-                    logger.info(f"Updating metadata for: {story.title}")
-                    self._update_metadata(story, provider)
+                for story in group:
+                    provider = keyed_provider or self.source_manager.get_provider_for_url(story.source_url)
 
-                    # Save metadata
-                    self.save_metadata(story)
+                    if provider:
+                        logger.info(f"Updating metadata for: {story.title}")
+                        self._update_metadata(story, provider)
+
+                        # Save metadata
+                        self.save_metadata(story)
 
             session.commit()
         except Exception as e:
@@ -756,297 +1299,260 @@ class StoryManager:
         finally:
             session.close()
 
-    def check_story_updates(self, story_id: int):
+    def check_story_updates(self, story_id: int, session: Optional[Session] = None):
         """
         Fetches metadata and chapter list for a single story and updates the database.
         """
-        session = SessionLocal()
-        try:
-            story = session.query(Story).filter(Story.id == story_id).first()
-            if not story:
-                raise ValueError(f"Story with ID {story_id} not found")
+        with self._session(session) as session:
+            try:
+                story = session.query(Story).filter(Story.id == story_id).first()
+                if not story:
+                    raise ValueError(f"Story with ID {story_id} not found")
 
-            logger.info(f"Checking updates for story: {story.title}")
+                logger.info(f"Checking updates for story: {story.title}")
 
-            provider = None
-            if story.provider_name:
-                provider = self.source_manager.get_provider_by_key(story.provider_name)
+                provider = self._resolve_provider(story)
 
-            if not provider:
-                provider = self.source_manager.get_provider_for_url(story.source_url)
+                if not provider:
+                    raise ValueError(f"No provider found for story: {story.title}")
 
-            if not provider:
-                raise ValueError(f"No provider found for story: {story.title}")
+                # Fetch metadata and update story
+                self._update_metadata(story, provider)
 
-            # Fetch metadata and update story
-            self._update_metadata(story, provider)
+                # Determine last chapter for optimization
+                last_chapter = self._get_last_chapter_info(session, story)
 
-            # Determine last chapter for optimization
-            last_chapter = self._get_last_chapter_info(story)
+                # Fetch current chapters from source
+                remote_chapters = provider.get_chapter_list(story.source_url, last_chapter=last_chapter)
 
-            # Fetch current chapters from source
-            remote_chapters = provider.get_chapter_list(story.source_url, last_chapter=last_chapter)
-
-            # Get existing chapters from DB
-            existing_chapter_urls = {c.source_url for c in story.chapters}
-
-            new_chapters_count = 0
-            for i, chap_data in enumerate(remote_chapters):
-                published_date = chap_data.get('published_date')
-                volume_title = chap_data.get('volume_title')
-                volume_number = chap_data.get('volume_number', 1)
-                idx = chap_data.get('index', i + 1)
-
-                tags_list = chap_data.get('tags', [])
-                tags_str = ','.join(tags_list) if tags_list else None
-
-                if chap_data['url'] not in existing_chapter_urls:
-                    new_chapter = Chapter(
-                        title=chap_data['title'],
-                        source_url=chap_data['url'],
-                        story_id=story.id,
-                        index=idx,
-                        status='pending',
-                        published_date=published_date,
-                        volume_title=volume_title,
-                        volume_number=volume_number,
-                        tags=tags_str
-                    )
-                    session.add(new_chapter)
-                    new_chapters_count += 1
-                else:
-                    # Update existing
-                     for ec in story.chapters:
-                         if ec.source_url == chap_data['url']:
-                             if not ec.published_date and published_date:
-                                 ec.published_date = published_date
-                             if ec.index != idx:
-                                 ec.index = idx
-                             if volume_title and ec.volume_title != volume_title:
-                                 ec.volume_title = volume_title
-                             if volume_number and ec.volume_number != volume_number:
-                                 ec.volume_number = volume_number
-                             if tags_str and ec.tags != tags_str:
-                                 ec.tags = tags_str
-                             break
-
-            story.last_checked = func.now()
-            if new_chapters_count > 0:
-                story.last_updated = func.now()
-                logger.info(f"Found {new_chapters_count} new chapters for '{story.title}'")
+                # Get existing chapters from DB
+                existing_by_url = _existing_chapters_by_url(session, story.id)
+                new_chapter_rows, chapter_updates = _merge_chapters(remote_chapters, existing_by_url, story.id)
 
-                # Notify
-                self.notification_manager.dispatch('on_new_chapters', {
-                    'story_title': story.title,
-                    'new_chapters_count': new_chapters_count,
-                    'story_id': story.id
-                })
-            else:
-                logger.info(f"No new chapters for '{story.title}'")
+                new_chapters_count = len(new_chapter_rows)
+                _write_merged_chapters(session, new_chapter_rows, chapter_updates)
 
-            session.commit()
+                now = datetime.utcnow()
+                story.last_checked = now
+                if new_chapters_count > 0:
+                    story.last_updated = now
+                    logger.info(f"Found {new_chapters_count} new chapters for '{story.title}'")
 
-            # Save metadata
-            self.save_metadata(story)
+                    # Notify
+                    self.notification_manager.dispatch('on_new_chapters', {
+                        'story_title': story.title,
+                        'new_chapters_count': new_chapters_count,
+                        'story_id': story.id
+                    })
+                else:
+                    logger.info(f"No new chapters for '{story.title}'")
 
-            return new_chapters_count
+                session.commit()
 
-        except Exception as e:
-            logger.error(f"Error checking updates for story {story_id}: {e}")
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+                # Save metadata
+                self.save_metadata(story)
+
+                return new_chapters_count
 
-    def retry_failed_chapters(self, story_id: int):
+            except Exception as e:
+                logger.error(f"Error checking updates for story {story_id}: {e}")
+                session.rollback()
+                raise e
+
+    def retry_failed_chapters(self, story_id: int, session: Optional[Session] = None):
         """
         Resets 'failed' chapters to 'pending' for the given story.
         """
-        session = SessionLocal()
-        try:
-            story = session.query(Story).filter(Story.id == story_id).first()
-            if not story:
-                raise ValueError(f"Story with ID {story_id} not found")
-
-            failed_chapters = session.query(Chapter).filter(
-                Chapter.story_id == story_id,
-                Chapter.status == 'failed'
-            ).all()
-
-            count = 0
-            for chapter in failed_chapters:
-                chapter.status = 'pending'
-                count += 1
+        with self._session(session) as session:
+            try:
+                story_title = session.query(Story.title).filter(Story.id == story_id).scalar()
+                if story_title is None:
+                    raise ValueError(f"Story with ID {story_id} not found")
+
+                # Single UPDATE; the row count is the number of chapters requeued
+                count = session.query(Chapter).filter(
+                    Chapter.story_id == story_id,
+                    Chapter.status == 'failed'
+                ).update({Chapter.status: 'pending'}, synchronize_session=False)
+
+                session.commit()
+                logger.info(f"Queued {count} failed chapters for retry for story '{story_title}'")
+                return count
+            except Exception as e:
+                logger.error(f"Error retrying chapters for story {story_id}: {e}")
+                session.rollback()
+                raise e
 
-            session.commit()
-            logger.info(f"Queued {count} failed chapters for retry for story '{story.title}'")
-            return count
-        except Exception as e:
-            logger.error(f"Error retrying chapters for story {story_id}: {e}")
-            session.rollback()
-            raise e
-        finally:
-            session.close()
-    def get_story_schedule(self, story_id: int):
+    def get_story_schedule(self, story_id: int, session: Optional[Session] = None):
         """
         Analyzes the release schedule for a story and predicts next chapter.
         """
-        session = SessionLocal()
-        try:
+        with self._session(session) as session:
             story = session.query(Story).filter(Story.id == story_id).first()
             if not story:
                 return None
 
-            chapters = session.query(Chapter).filter(
+            first_date, last_date, dated_count = session.query(
+                func.min(Chapter.published_date),
+                func.max(Chapter.published_date),
+                func.count(Chapter.id)
+            ).filter(
                 Chapter.story_id == story_id,
                 Chapter.published_date != None
-            ).order_by(Chapter.published_date).all()
+            ).one()
 
-            if len(chapters) < 2:
+            if dated_count < 2:
                 return {
                     'story_title': story.title,
                     'prediction': None,
                     'history': []
                 }
 
-            # Calculate intervals
-            dates = [c.published_date for c in chapters]
-            intervals = []
-            for i in range(1, len(dates)):
-                delta = dates[i] - dates[i-1]
-                intervals.append(delta.total_seconds())
-
-            avg_interval_seconds = sum(intervals) / len(intervals)
-
-            last_date = dates[-1]
+            avg_interval_seconds = _average_interval_seconds(first_date, last_date, dated_count)
             next_date = last_date + timedelta(seconds=avg_interval_seconds)
 
             return {
                 'story_title': story.title,
                 'prediction': next_date,
                 'avg_interval_days': avg_interval_seconds / 86400,
-                'history_count': len(chapters)
+                'history_count': dated_count
             }
-        finally:
-            session.close()
 
     def delete_story(self, story_id: int, delete_content: bool):
         """
         Deletes a story and optionally its downloaded content.
+        Database records are removed and committed first; file cleanup runs afterwards
+        so slow filesystem work does not hold the database write lock.
         """
-        session = SessionLocal()
         try:
-            story = session.query(Story).filter(Story.id == story_id).first()
-            if not story:
-                raise ValueError(f"Story with ID {story_id} not found")
+            with session_scope() as session:
+                story = session.query(Story).filter(Story.id == story_id).first()
+                if not story:
+                    raise ValueError(f"Story with ID {story_id} not found")
 
-            if delete_content:
-                logger.info(f"Deleting content for story '{story.title}'...")
+                story_title = story.title
+                # Resolve the content path while the story is still loaded
+                story_path = self.library_manager.get_story_path(story) if delete_content else None
 
-                # Delete new structure
-                story_path = self.library_manager.get_story_path(story)
-                if story_path.exists():
-                    try:
-                        shutil.rmtree(story_path)
-                        logger.info(f"Deleted story directory: {story_path}")
-                    except Exception as e:
-                        logger.error(f"Failed to delete directory {story_path}: {e}")
-
-                # Cleanup Legacy Paths (Best Effort)
-                download_path = config_manager.get('download_path', 'verification_downloads')
-                try:
-                    candidates = glob.glob(os.path.join(download_path, f"{story_id}_*"))
-                    for cand in candidates:
-                        if os.path.isdir(cand):
-                            shutil.rmtree(cand)
-                            logger.info(f"Deleted legacy directory: {cand}")
-                except Exception as e:
-                     logger.error(f"Error during fallback deletion: {e}")
+                # Delete database records
+                # Manually delete history
+                session.query(DownloadHistory).filter(DownloadHistory.story_id == story_id).delete()
 
-            # Delete database records
-            # Manually delete history
-            session.query(DownloadHistory).filter(DownloadHistory.story_id == story_id).delete()
+                # Delete story (cascades to chapters)
+                session.delete(story)
 
-            # Delete story (cascades to chapters)
-            session.delete(story)
-            session.commit()
+            self._metadata_hashes.pop(story_id, None)
             logger.info(f"Story {story_id} deleted.")
 
         except Exception as e:
-            session.rollback()
             logger.error(f"Error deleting story {story_id}: {e}")
             raise e
-        finally:
-            session.close()
 
-    def get_calendar_events(self, start=None, end=None):
+        if delete_content:
+            self._delete_story_content(story_id, story_title, story_path)
+
+    def _delete_story_content(self, story_id: int, story_title: str, story_path: Path):
         """
-        Returns calendar events for all stories.
+        Removes the story directory and any legacy download directories (best effort).
         """
-        session = SessionLocal()
+        logger.info(f"Deleting content for story '{story_title}'...")
+
+        # Delete new structure
+        if story_path.exists():
+            try:
+                shutil.rmtree(story_path)
+                logger.info(f"Deleted story directory: {story_path}")
+            except Exception as e:
+                logger.error(f"Failed to delete directory {story_path}: {e}")
+
+        # Cleanup Legacy Paths (Best Effort)
+        download_path = config_manager.get('download_path', 'verification_downloads')
+        prefix = f"{story_id}_"
         try:
-            stories = session.query(Story).filter(Story.is_monitored == True).all()
-            events = []
+            # scandir reports the entry type from readdir, so no extra stat per entry
+            with os.scandir(download_path) as entries:
+                candidates = [
+                    entry.path for entry in entries
+                    if entry.name.startswith(prefix) and entry.is_dir(follow_symlinks=False)
+                ]
+            if candidates:
+                # Bounded so rotational disks are not thrashed by concurrent tree walks
+                with ThreadPoolExecutor(max_workers=min(LEGACY_DELETE_WORKERS, len(candidates))) as executor:
+                    list(executor.map(_fast_rmtree, candidates))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+             logger.error(f"Error during fallback deletion: {e}")
 
-            for story in stories:
-                # Get history
-                chapters = session.query(Chapter).filter(
-                    Chapter.story_id == story.id,
-                    Chapter.published_date != None
-                ).all()
-
-                for chap in chapters:
-                    events.append({
-                        'title': f"{story.title} - {chap.title}",
-                        'start': chap.published_date.isoformat(),
+    def get_calendar_events(self, start=None, end=None):
+        """
+        Yields calendar events for all stories.
+        Events are produced lazily so callers can stream them without building the full list.
+        """
+        with session_scope() as session:
+            if session.get_bind().dialect.name == 'sqlite':
+                # SQLite stores DateTime as text, so take the stored string as is
+                # and only parse the dates the cadence actually needs
+                published_column = type_coerce(Chapter.published_date, String)
+                to_iso = _sqlite_datetime_isoformat
+                to_datetime = datetime.fromisoformat
+            else:
+                published_column = Chapter.published_date
+                to_iso = datetime.isoformat
+                to_datetime = lambda value: value
+            history_columns = [Chapter.story_id, Story.title.label('story_title'), Chapter.title, published_column.label('published')]
+
+            # One query for the dated chapters of every monitored story, sorted by story then date
+            rows = session.query(*history_columns).join(Story, Chapter.story_id == Story.id).filter(
+                Story.is_monitored == True,
+                Chapter.published_date != None
+            ).order_by(Chapter.story_id, Chapter.published_date)
+
+            now = datetime.now()
+            for story_id, group in groupby(rows, key=attrgetter('story_id')):
+                # Single pass: emit history while noting what the cadence needs
+                # (rows arrive sorted by date within each story)
+                dated_count = 0
+                for chap in group:
+                    if dated_count == 0:
+                        story_title = chap.story_title
+                        first_published = chap.published
+                    dated_count += 1
+                    yield {
+                        'title': f"{story_title} - {chap.title}",
+                        'start': to_iso(chap.published),
                         'color': '#3788d8', # Blue for past
-                        'url': f"/story/{story.id}"
-                    })
+                        'url': f"/story/{story_id}"
+                    }
+                last_date = to_datetime(chap.published)
 
-                # Prediction (we call internal method but need new session or pass session)
-                # To avoid session conflict, we can reimplement logic or use the same session if refactored.
-                # Here we just re-query chapters which is fine but slightly inefficient.
-                # Actually, calling self.get_story_schedule creates a NEW session. This is fine as long as we are not in a transaction that blocks.
-                # But since we are inside a session here, it might be better to close this one or make get_story_schedule accept a session.
-
-                # Let's reimplement lightweight prediction here or rely on the other method.
-                # Since we are using SQLite with check_same_thread=False, it should be OK.
-
-                # But wait, get_story_schedule opens a session.
-                # Let's just use the current session to query chapters for prediction.
-
-                sorted_dates = sorted([c.published_date for c in chapters if c.published_date])
-                if len(sorted_dates) >= 2:
-                     intervals = []
-                     for i in range(1, len(sorted_dates)):
-                         delta = sorted_dates[i] - sorted_dates[i-1]
-                         intervals.append(delta.total_seconds())
-
-                     avg = sum(intervals) / len(intervals)
-
-                     # Predict next 5 chapters
-                     last_date = sorted_dates[-1]
-                     now = datetime.now()
-
-                     # Start from the last known date
-                     next_prediction = last_date + timedelta(seconds=avg)
-
-                     # Find the next valid slot in the FUTURE
-                     # We keep adding the interval to the original cadence until we land in the future.
-                     # This preserves the rhythm (e.g. every 2 days) rather than resetting the clock to 'now'.
-                     while next_prediction < now:
-                         next_prediction += timedelta(seconds=avg)
-
-                     for i in range(5):
-                        events.append({
-                            'title': f"{story.title} - Predicted",
-                            'start': next_prediction.isoformat(),
-                            'color': '#28a745', # Green
-                            'url': f"/story/{story.id}",
-                            'allDay': True
-                        })
-                        next_prediction += timedelta(seconds=avg)
-
-            return events
-        finally:
-            session.close()
+                # Need at least two dated chapters to derive a cadence
+                if dated_count < 2:
+                    continue
+
+                avg = _average_interval_seconds(to_datetime(first_published), last_date, dated_count)
+
+                # Chapters all published at the same instant give no usable cadence
+                if avg <= 0:
+                    continue
+
+                # Predict next 5 chapters
+                # Start from the last known date
+                next_prediction = last_date + timedelta(seconds=avg)
+
+                # Find the next valid slot in the FUTURE
+                # Skip straight past every missed interval rather than stepping through them,
+                # preserving the rhythm (e.g. every 2 days) instead of resetting the clock to 'now'.
+                if next_prediction < now:
+                    missed = math.ceil((now - next_prediction).total_seconds() / avg)
+                    next_prediction += timedelta(seconds=avg * missed)
+
+                for i in range(5):
+                    yield {
+                        'title': f"{story_title} - Predicted",
+                        'start': next_prediction.isoformat(),
+                        'color': '#28a745', # Green
+                        'url': f"/story/{story_id}",
+                        'allDay': True
+                    }
+                    next_prediction += timedelta(seconds=avg)
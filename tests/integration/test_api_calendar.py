@@ -0,0 +1,50 @@
+import os
+import unittest
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unittest.mock import MagicMock, patch
+from fastapi.testclient import TestClient
+from scrollarr.app import app
+
+class TestApiCalendar(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+        self.story_manager = MagicMock()
+        patcher = patch('scrollarr.app.story_manager', self.story_manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_streams_events(self):
+        self.story_manager.get_calendar_events.return_value = iter([{'id': 1}, {'id': 2}])
+
+        response = self.client.get("/api/calendar")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{'id': 1}, {'id': 2}])
+
+        self.story_manager.get_calendar_events.return_value = iter([])
+        self.assertEqual(self.client.get("/api/calendar").json(), [])
+
+    def test_query_error_returns_500(self):
+        def events():
+            raise RuntimeError("database is locked")
+            yield
+
+        self.story_manager.get_calendar_events.return_value = events()
+
+        response = self.client.get("/api/calendar")
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {'detail': 'database is locked'})
+
+    def test_error_mid_stream_aborts_response(self):
+        def events():
+            yield {'id': 1}
+            raise RuntimeError("connection lost")
+
+        self.story_manager.get_calendar_events.return_value = events()
+
+        # The array is never closed; the failure reaches the server instead
+        with self.assertRaises(RuntimeError):
+            self.client.get("/api/calendar")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import unittest
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from scrollarr.database import Base, Story, Chapter
+from scrollarr.app import app, get_db
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_api_progress.db"
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+class TestApiProgress(unittest.TestCase):
+    def setUp(self):
+        Base.metadata.create_all(bind=engine)
+        # Installed per test so it doesn't clash with other modules overriding get_db
+        self.previous_override = app.dependency_overrides.get(get_db)
+        app.dependency_overrides[get_db] = override_get_db
+        self.client = TestClient(app)
+        self.db = TestingSessionLocal()
+
+    def tearDown(self):
+        self.db.close()
+        if self.previous_override:
+            app.dependency_overrides[get_db] = self.previous_override
+        else:
+            app.dependency_overrides.pop(get_db, None)
+        Base.metadata.drop_all(bind=engine)
+        if os.path.exists("./test_api_progress.db"):
+            os.remove("./test_api_progress.db")
+
+    def test_progress_counts(self):
+        story = Story(title="Counted", author="Author", source_url="http://test.com/counted", status="Monitoring")
+        empty = Story(title="Empty", author="Author", source_url="http://test.com/empty", status="Monitoring")
+        self.db.add_all([story, empty])
+        self.db.flush()
+        self.db.add_all([
+            Chapter(story_id=story.id, title="1", source_url="http://test.com/counted/1", index=1, status="downloaded"),
+            Chapter(story_id=story.id, title="2", source_url="http://test.com/counted/2", index=2, status="failed"),
+            Chapter(story_id=story.id, title="3", source_url="http://test.com/counted/3", index=3, status="pending"),
+            Chapter(story_id=story.id, title="4", source_url="http://test.com/counted/4", index=4, status="downloaded"),
+        ])
+        self.db.commit()
+
+        response = self.client.get("/api/progress")
+        self.assertEqual(response.status_code, 200)
+        by_title = {item['title']: item for item in response.json()}
+
+        self.assertEqual(by_title['Counted']['total'], 4)
+        self.assertEqual(by_title['Counted']['downloaded'], 2)
+        self.assertEqual(by_title['Counted']['failed'], 1)
+        self.assertEqual(by_title['Counted']['progress'], 50.0)
+        self.assertEqual(by_title['Empty']['total'], 0)
+        self.assertEqual(by_title['Empty']['progress'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
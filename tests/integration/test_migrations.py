@@ -0,0 +1,63 @@
+import os
+import unittest
+import sys
+import importlib.util
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, text
+from scrollarr.database import Base
+
+VERSIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'alembic', 'versions')
+
+def load_migration(filename):
+    spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(VERSIONS_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+class TestChapterUrlUniqueMigration(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            # The state before the migration: no unique index, duplicate chapter rows
+            conn.execute(text("DROP INDEX uq_chapter_story_url"))
+            conn.execute(text(
+                "INSERT INTO stories (id, title, author, source_url) VALUES (1, 'Story', 'Author', 'http://example.com/s')"
+            ))
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def upgrade(self):
+        migration = load_migration('20260225_add_chapter_url_unique.py')
+        with self.engine.begin() as conn:
+            with Operations.context(MigrationContext.configure(conn)):
+                migration.upgrade()
+
+    def insert_chapter(self, conn, chapter_id, source_url, is_downloaded=False, local_path=None):
+        conn.execute(text(
+            "INSERT INTO chapters (id, story_id, title, source_url, is_downloaded, local_path) "
+            "VALUES (:id, 1, 'Chapter', :url, :is_downloaded, :local_path)"
+        ), {'id': chapter_id, 'url': source_url, 'is_downloaded': is_downloaded, 'local_path': local_path})
+
+    def test_keeps_downloaded_duplicate(self):
+        with self.engine.begin() as conn:
+            self.insert_chapter(conn, 1, 'http://example.com/1')
+            self.insert_chapter(conn, 2, 'http://example.com/1', is_downloaded=True, local_path='/lib/1.html')
+            self.insert_chapter(conn, 3, 'http://example.com/2')
+            self.insert_chapter(conn, 4, 'http://example.com/2')
+
+        self.upgrade()
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(text("SELECT id, source_url, local_path FROM chapters ORDER BY id")).fetchall()
+        # The newer but downloaded copy wins; otherwise the oldest row is kept
+        self.assertEqual([tuple(row) for row in rows], [
+            (2, 'http://example.com/1', '/lib/1.html'),
+            (3, 'http://example.com/2', None),
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
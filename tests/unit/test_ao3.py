@@ -105,7 +105,7 @@ class TestAO3Source(unittest.TestCase):
     def test_get_chapter_list_single(self):
         # Mock navigate page returning nothing (or empty list)
 
-        def side_effect(url):
+        def side_effect(url, **kwargs):
             mock_resp = MagicMock()
             if "navigate" in url:
                 mock_resp.text = "<html><body></body></html>"
@@ -149,5 +149,57 @@ class TestAO3Source(unittest.TestCase):
         self.assertIn("This is the chapter content.", content)
         self.assertNotIn("Chapter Text", content)
 
+    def test_get_metadata_work_meta_outside_workskin(self):
+        # Live AO3 layout: the tag block sits before #workskin, comments follow it
+        html = """
+        <html>
+            <body>
+                <ul class="primary navigation actions"><li><a href="/">Home</a></li></ul>
+                <div class="wrapper">
+                    <dl class="work meta group">
+                        <dt class="rating tags">Rating:</dt>
+                        <dd class="rating tags"><ul><li><a class="tag">Teen And Up Audiences</a></li></ul></dd>
+                        <dt class="language">Language:</dt>
+                        <dd class="language">Deutsch</dd>
+                        <dd class="fandom tags"><ul><li><a class="tag">Star Wars</a></li></ul></dd>
+                        <dd class="stats"><dl class="stats"><dt class="chapters">Chapters:</dt><dd class="chapters">3/?</dd></dl></dd>
+                    </dl>
+                </div>
+                <div id="workskin">
+                    <div class="preface group">
+                        <h2 class="title heading">Live Layout</h2>
+                        <h3 class="byline heading"><a href="/users/writer">writer</a></h3>
+                        <div class="summary module"><blockquote class="userstuff"><p>Summary text.</p></blockquote></div>
+                    </div>
+                </div>
+                <div id="feedback"><ol class="thread"><li>A comment</li></ol></div>
+            </body>
+        </html>
+        """
+        self.ao3.requester.get.return_value = MagicMock(text=html)
+        metadata = self.ao3.get_metadata("https://archiveofourown.org/works/789")
+
+        self.assertEqual(metadata['title'], "Live Layout")
+        self.assertEqual(metadata['author'], "writer")
+        self.assertEqual(metadata['rating'], "Teen And Up Audiences")
+        self.assertEqual(metadata['language'], "Deutsch")
+        self.assertEqual(metadata['tags'], "Star Wars")
+        self.assertEqual(metadata['publication_status'], "Ongoing")
+
+    def test_get_chapter_content_without_chapters_container(self):
+        html = """
+        <html>
+            <body>
+                <div class="userstuff"><p>Oneshot body.</p></div>
+            </body>
+        </html>
+        """
+        self.ao3.requester.get.side_effect = None
+        self.ao3.requester.get.return_value = MagicMock(text=html)
+
+        content = self.ao3.get_chapter_content("https://archiveofourown.org/works/123")
+
+        self.assertIn("Oneshot body.", content)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,9 @@
 import os
 import sys
+import tempfile
 import unittest
+import zipfile
+from unittest.mock import MagicMock, patch
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scrollarr.ebook_builder import EbookBuilder
 
@@ -27,5 +30,50 @@ class TestEbookBuilder(unittest.TestCase):
         self.assertTrue(os.path.exists(self.output_path))
         print(f"Verified {self.output_path} exists.")
 
+    def test_compile_chapters_keeps_order_and_skips_missing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            chapters = []
+            for i in range(20):
+                chapter = MagicMock()
+                chapter.id = i
+                chapter.title = f"Chapter {i}"
+                chapter.local_path = os.path.join(tmp, f"{i}.html")
+                if i != 5:
+                    with open(chapter.local_path, 'w', encoding='utf-8') as f:
+                        f.write(f"<p>{i}</p>")
+                chapters.append(chapter)
+
+            story = MagicMock()
+            story.profile = None
+            self.builder.library_manager = MagicMock()
+            with patch.object(EbookBuilder, 'make_epub') as mock_make_epub:
+                self.builder._compile_chapters(story, chapters, "Full")
+
+        epub_chapters = mock_make_epub.call_args[0][2]
+        self.assertEqual(
+            [c['path'] for c in epub_chapters],
+            [os.path.join(tmp, f"{i}.html") for i in range(20) if i != 5]
+        )
+
+    def test_make_epub_reads_chapter_paths(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            chapter_path = os.path.join(tmp, "1.html")
+            with open(chapter_path, 'w', encoding='utf-8') as f:
+                f.write("<p>Streamed from disk.</p>")
+
+            chapters = [
+                {'title': 'From Path', 'path': chapter_path},
+                {'title': 'Inline', 'content': '<p>Held in memory.</p>'}
+            ]
+            self.builder.make_epub("Test Story", "Test Author", chapters, self.output_path)
+
+        with zipfile.ZipFile(self.output_path) as book:
+            names = book.namelist()
+            first = book.read(next(n for n in names if n.endswith('chapter_1.xhtml'))).decode('utf-8')
+            second = book.read(next(n for n in names if n.endswith('chapter_2.xhtml'))).decode('utf-8')
+        self.assertIn("Streamed from disk.", first)
+        self.assertIn("<h1>From Path</h1>", first)
+        self.assertIn("Held in memory.", second)
+
 if __name__ == '__main__':
     unittest.main()
@@ -91,9 +91,10 @@ class TestEbookBuilderVolume(unittest.TestCase):
         # The return value is string
         self.assertEqual(os.path.normpath(output_path), os.path.normpath(expected_path))
 
+        # Chapters without images are handed over by path and read when the EPUB is written
         expected_chapters = [
-            {'title': 'Chapter 1', 'content': '<p>Content</p>'},
-            {'title': 'Chapter 2', 'content': '<p>Content</p>'}
+            {'title': 'Chapter 1', 'path': 'path/to/1.html'},
+            {'title': 'Chapter 2', 'path': 'path/to/2.html'}
         ]
 
         # Title passed to make_epub is "{story.title} - {suffix}" -> "Test Story - Vol 1"
@@ -15,7 +15,7 @@ class TestImageProcessing(unittest.TestCase):
 
     @patch('scrollarr.story_manager.init_db')
     @patch('scrollarr.story_manager.SessionLocal')
-    @patch('scrollarr.story_manager.requests.get')
+    @patch('scrollarr.story_manager.requests.Session.get')
     @patch('scrollarr.story_manager.open', new_callable=mock_open)
     @patch('pathlib.Path.exists')
     @patch('os.makedirs')
@@ -101,6 +101,8 @@ class TestImageProcessing(unittest.TestCase):
         for call in write_calls:
             args, _ = call
             content = args[0]
+            if isinstance(content, bytes):
+                content = content.decode('utf-8')
             if isinstance(content, str) and '<img' in content:
                 # Calculate expected relative path
                 # from /tmp/lib/Test Story (1)/chapters/1.html (parent is chapters)
@@ -119,6 +121,8 @@ class TestImageProcessing(unittest.TestCase):
         for call in write_calls:
             args, _ = call
             content = args[0]
+            if isinstance(content, bytes):
+                content = content.decode('utf-8')
             if isinstance(content, str) and 'data-original-src="http://example.com/image.jpg"' in content:
                 html_has_orig = True
                 break
@@ -196,7 +200,7 @@ class TestImageProcessing(unittest.TestCase):
 
     @patch('scrollarr.story_manager.init_db')
     @patch('scrollarr.story_manager.SessionLocal')
-    @patch('scrollarr.story_manager.requests.get')
+    @patch('scrollarr.story_manager.requests.Session.get')
     @patch('scrollarr.story_manager.open', new_callable=mock_open)
     @patch('pathlib.Path.exists')
     @patch('os.makedirs')
@@ -267,6 +271,8 @@ class TestImageProcessing(unittest.TestCase):
         for call in write_calls:
             args, _ = call
             content = args[0]
+            if isinstance(content, bytes):
+                content = content.decode('utf-8')
             if isinstance(content, str) and 'src="../images/img_' in content:
                 html_updated = True
                 break
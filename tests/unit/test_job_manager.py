@@ -128,7 +128,7 @@ class TestJobManager(unittest.TestCase):
 
         mock_provider.get_chapter_content.assert_called_with("http://example.com/ch1")
         mock_file.assert_called()
-        mock_file().write.assert_called_with("<html>Content</html>")
+        mock_file().write.assert_called_with(b"<html>Content</html>")
 
         updated_chapter = self.session.query(Chapter).filter(Chapter.id == chapter.id).first()
         self.assertEqual(updated_chapter.status, 'downloaded')
@@ -62,5 +62,10 @@ class TestLibraryNaming(unittest.TestCase):
         name = self.lm.get_compiled_filename(story, suffix="CustomSuffix", chapters=chapters, file_type='legacy')
         self.assertEqual(name, "Legacy_MyStory_CustomSuffix.epub")
 
+    def test_sanitize_filename(self):
+        self.assertEqual(self.lm.sanitize_filename(' Re:Zero / Arc 1? '), 'ReZero  Arc 1')
+        self.assertEqual(self.lm.sanitize_filename('Über_title-v1.2'), 'Über_title-v1.2')
+        self.assertEqual(self.lm.sanitize_filename(''), 'unknown')
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,14 +4,16 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from unittest.mock import patch, Mock
 import time
-from scrollarr.polite_requester import PoliteRequester
+import requests
+from scrollarr.config import config_manager
+from scrollarr.polite_requester import PoliteRequester, MAX_RETRY_AFTER, _limiter_for
 
 class TestPoliteRequester(unittest.TestCase):
     def setUp(self):
         self.requester = PoliteRequester(delay_range=(2, 5))
 
     @patch('time.sleep')
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_request_calls_requests_with_correct_headers(self, mock_get, mock_sleep):
         # Setup mock response
         mock_response = Mock()
@@ -21,7 +23,7 @@ class TestPoliteRequester(unittest.TestCase):
         url = "http://example.com"
         self.requester.get(url)
 
-        # Verify requests.get was called with the URL and headers
+        # Verify the session's get was called with the URL and headers
         mock_get.assert_called_once()
         args, kwargs = mock_get.call_args
         self.assertEqual(args[0], url)
@@ -30,7 +32,7 @@ class TestPoliteRequester(unittest.TestCase):
         self.assertIn('Accept-Language', kwargs['headers'])
 
     @patch('time.sleep')
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_request_waits_random_delay(self, mock_get, mock_sleep):
         # Setup mock response
         mock_response = Mock()
@@ -48,7 +50,7 @@ class TestPoliteRequester(unittest.TestCase):
         self.assertLessEqual(delay, 5)
 
     @patch('time.sleep')
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_request_raises_for_status(self, mock_get, mock_sleep):
         # Setup mock response to raise an error
         mock_response = Mock()
@@ -59,5 +61,95 @@ class TestPoliteRequester(unittest.TestCase):
         with self.assertRaises(Exception):
             self.requester.get(url)
 
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_revalidate_reuses_response_on_not_modified(self, mock_get, mock_sleep):
+        first = Mock()
+        first.status_code = 200
+        first.headers = {'ETag': '"abc"'}
+        first.content = b'<ol>toc</ol>'
+        first.encoding = 'utf-8'
+        not_modified = Mock()
+        not_modified.status_code = 304
+        mock_get.side_effect = [first, not_modified]
+
+        url = "http://example.com/toc"
+        self.assertIs(self.requester.get(url, revalidate=True), first)
+        replayed = self.requester.get(url, revalidate=True)
+        self.assertEqual(replayed.status_code, 200)
+        self.assertEqual(replayed.text, '<ol>toc</ol>')
+        self.assertEqual(replayed.headers['ETag'], '"abc"')
+
+        # The second request is conditional on the stored ETag
+        self.assertNotIn('If-None-Match', mock_get.call_args_list[0][1]['headers'])
+        self.assertEqual(mock_get.call_args_list[1][1]['headers']['If-None-Match'], '"abc"')
+        not_modified.raise_for_status.assert_not_called()
+
+    @patch('scrollarr.polite_requester.REVALIDATE_CACHE_BYTES', 10)
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_revalidate_cache_is_capped_by_bytes(self, mock_get, mock_sleep):
+        def page(body):
+            response = Mock()
+            response.status_code = 200
+            response.headers = {'Last-Modified': 'Wed, 01 Jan 2025 00:00:00 GMT'}
+            response.content = body
+            response.encoding = 'utf-8'
+            return response
+        mock_get.side_effect = [page(b'123456'), page(b'abcdef'), page(b'x' * 11)]
+
+        self.requester.get("http://example.com/a", revalidate=True)
+        self.requester.get("http://example.com/b", revalidate=True)
+        self.requester.get("http://example.com/c", revalidate=True)
+
+        # /a was evicted to make room for /b; /c alone exceeds the cap and is not kept
+        self.assertEqual(list(self.requester._revalidate_cache), ["http://example.com/b"])
+        self.assertEqual(self.requester._revalidate_cache_bytes, 6)
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_retries_after_too_many_requests(self, mock_get, mock_sleep):
+        throttled = Mock()
+        throttled.status_code = 429
+        throttled.headers = {'Retry-After': '7'}
+        ok = Mock()
+        ok.status_code = 200
+        ok.headers = {}
+        mock_get.side_effect = [throttled, ok]
+
+        self.assertIs(self.requester.get("http://example.com/busy"), ok)
+        self.assertEqual(mock_get.call_count, 2)
+        # The server's Retry-After is honoured before the second attempt
+        self.assertIn(7.0, [c[0][0] for c in mock_sleep.call_args_list])
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_gives_up_on_excessive_retry_after(self, mock_get, mock_sleep):
+        throttled = Mock()
+        throttled.status_code = 429
+        throttled.headers = {'Retry-After': '86400'}
+        throttled.raise_for_status.side_effect = requests.HTTPError("429 Too Many Requests")
+        mock_get.return_value = throttled
+
+        with self.assertRaises(requests.HTTPError):
+            self.requester.get("http://example.com/busy")
+
+        # One attempt, and no wait anywhere near what the server asked for
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertTrue(all(c[0][0] <= MAX_RETRY_AFTER for c in mock_sleep.call_args_list))
+
+    def test_host_limiter_follows_config_changes(self):
+        url = "http://limited.example.org/page"
+        with patch.dict(config_manager.config, {'host_rate_limits': {'example.org': 2.0}}):
+            limiter = _limiter_for(url)
+            self.assertEqual(limiter.interval, 0.5)
+            self.assertIs(_limiter_for(url), limiter)
+
+            config_manager.config['host_rate_limits'] = {'example.org': 4.0}
+            self.assertEqual(_limiter_for(url).interval, 0.25)
+
+            config_manager.config['host_rate_limits'] = {}
+            self.assertIsNone(_limiter_for(url))
+
 if __name__ == '__main__':
     unittest.main()
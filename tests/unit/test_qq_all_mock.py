@@ -70,7 +70,7 @@ class TestQQAllPosts(unittest.TestCase):
         </html>
         """
 
-        def side_effect(req_url):
+        def side_effect(req_url, **kwargs):
             if 'threadmarks' in req_url:
                 m = MagicMock()
                 m.text = html_tm
@@ -58,7 +58,7 @@ class TestQQOptimization(unittest.TestCase):
         </html>
         """
 
-        def side_effect(req_url, allow_redirects=True):
+        def side_effect(req_url, allow_redirects=True, **kwargs):
             if 'threadmarks' in req_url:
                 m = MagicMock()
                 m.text = html_tm
@@ -159,7 +159,7 @@ class TestQQOptimization(unittest.TestCase):
         </html>
         """
 
-        def side_effect(req_url, allow_redirects=True):
+        def side_effect(req_url, allow_redirects=True, **kwargs):
             if 'threadmarks' in req_url:
                 m = MagicMock()
                 m.text = html_tm
@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import MagicMock
+
+from scrollarr.core_logic import SourceManager
+
+
+class TestSourceManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = SourceManager()
+
+        self.rr = MagicMock()
+        self.rr.key = 'royalroad'
+        self.rr.identify.side_effect = lambda url: 'royalroad.com' in url
+
+        self.ao3 = MagicMock()
+        self.ao3.key = 'ao3'
+        self.ao3.identify.side_effect = lambda url: 'archiveofourown.org' in url
+
+        self.manager.register_provider(self.rr)
+        self.manager.register_provider(self.ao3)
+
+    def test_get_provider_for_url_is_cached(self):
+        url = 'https://archiveofourown.org/works/1'
+        self.assertIs(self.manager.get_provider_for_url(url), self.ao3)
+        self.assertIs(self.manager.get_provider_for_url(url), self.ao3)
+        self.assertEqual(self.ao3.identify.call_count, 1)
+
+        self.assertIsNone(self.manager.get_provider_for_url('https://example.com/story'))
+
+    def test_host_hint_skips_scan(self):
+        self.assertIs(self.manager.get_provider_for_url('https://archiveofourown.org/works/1'), self.ao3)
+        self.rr.identify.reset_mock()
+
+        # A new URL on a known host is checked against the hinted provider first
+        self.assertIs(self.manager.get_provider_for_url('https://archiveofourown.org/works/2'), self.ao3)
+        self.rr.identify.assert_not_called()
+
+    def test_get_provider_by_key(self):
+        self.assertIs(self.manager.get_provider_by_key('royalroad'), self.rr)
+        self.assertIsNone(self.manager.get_provider_by_key('missing'))
+
+    def test_cache_cleared_when_providers_change(self):
+        url = 'https://www.royalroad.com/fiction/1'
+        self.assertIs(self.manager.get_provider_for_url(url), self.rr)
+        self.assertIs(self.manager.get_provider_by_key('royalroad'), self.rr)
+
+        replacement = MagicMock()
+        replacement.key = 'royalroad'
+        replacement.identify.return_value = True
+        self.manager.providers = [replacement]
+
+        self.assertIs(self.manager.get_provider_for_url(url), replacement)
+        self.assertIs(self.manager.get_provider_by_key('royalroad'), replacement)
+
+        self.manager.clear_providers()
+        self.assertIsNone(self.manager.get_provider_for_url(url))
+
+
+if __name__ == '__main__':
+    unittest.main()
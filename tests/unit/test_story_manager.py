@@ -9,10 +9,15 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import unittest
 import shutil
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock
-from scrollarr.story_manager import StoryManager
-from scrollarr.database import Story, Chapter, Base
-from sqlalchemy import create_engine
+from scrollarr.story_manager import StoryManager, _apply_story_metadata
+from scrollarr.database import Story, Chapter, Source, Base
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import sessionmaker
 from scrollarr import database
 from unittest.mock import patch
@@ -22,6 +27,8 @@ class TestStoryManager(unittest.TestCase):
         # Create new engine/session pointing to test DB
         self.test_db_url = 'sqlite:///test_library.db'
         self.test_engine = create_engine(self.test_db_url, connect_args={"check_same_thread": False})
+        # Same PRAGMAs as the application engine
+        database.configure_sqlite_engine(self.test_engine)
         self.TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.test_engine)
 
         # Patch database module (for modules that import it dynamically or use database.SessionLocal)
@@ -164,7 +171,8 @@ class TestStoryManager(unittest.TestCase):
     def test_get_pending_chapters(self):
         story_id = self.manager.add_story("http://example.com/story")
         pending_chapters = self.manager.get_pending_chapters()
-
+        # Materialized, so no cursor or connection outlives the call
+        self.assertIsInstance(pending_chapters, list)
         self.assertEqual(len(pending_chapters), 2)
         self.assertEqual(pending_chapters[0].story_id, story_id)
         self.assertEqual(pending_chapters[0].status, 'pending')
@@ -178,6 +186,32 @@ class TestStoryManager(unittest.TestCase):
         pending_chapters = self.manager.get_pending_chapters()
         self.assertEqual(len(pending_chapters), 0)
 
+    def test_get_pending_chapters_strict_loads(self):
+        self.manager.add_story("http://example.com/story")
+        with patch('scrollarr.story_manager.config_manager.get',
+                   side_effect=lambda key, default=None: True if key == 'strict_orm_loads' else default):
+            pending_chapters = self.manager.get_pending_chapters()
+
+        # The eagerly loaded parent is still available, further lazy loads raise
+        self.assertEqual(pending_chapters[0].story.title, 'Test Story')
+        with self.assertRaises(InvalidRequestError):
+            pending_chapters[0].story.chapters
+
+    def test_reload_providers_skips_unchanged_sources(self):
+        # setUp swapped in a mock provider; an unchanged DB keeps the registered set
+        self.manager.reload_providers()
+        self.assertEqual(self.manager.source_manager.providers, [self.mock_provider])
+
+        session = database.SessionLocal()
+        source = session.query(Source).first()
+        source.is_enabled = not source.is_enabled
+        session.commit()
+        session.close()
+
+        self.manager.reload_providers()
+        self.assertNotIn(self.mock_provider, self.manager.source_manager.providers)
+        self.assertTrue(self.manager.source_manager.providers)
+
     def test_update_library(self):
         # 1. Add a story with 2 chapters
         self.mock_provider.get_chapter_list.return_value = [
@@ -202,10 +236,17 @@ class TestStoryManager(unittest.TestCase):
         # 3. Call update_library
         self.manager.update_library()
 
+        # The provider is told about the highest-indexed chapter already stored
+        last_chapter = self.mock_provider.get_chapter_list.call_args[1]['last_chapter']
+        self.assertEqual(last_chapter['url'], 'http://example.com/2')
+        self.assertEqual(last_chapter['index'], 2)
+
         # 4. Verify new chapter is added
         session = database.SessionLocal()
         story = session.query(Story).filter(Story.id == story_id).first()
         self.assertEqual(len(story.chapters), 3)
+        self.assertIsNotNone(story.last_checked)
+        self.assertEqual(story.last_updated, story.last_checked)
 
         # Check specific chapter
         new_chapter = session.query(Chapter).filter(Chapter.source_url == 'http://example.com/3').first()
@@ -216,6 +257,219 @@ class TestStoryManager(unittest.TestCase):
 
         session.close()
 
+    def test_update_library_skips_update_for_unchanged_metadata(self):
+        self.manager.add_story("http://example.com/story")
+
+        statements = []
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        event.listen(self.test_engine, "before_cursor_execute", record)
+        try:
+            self.manager.update_library()
+        finally:
+            event.remove(self.test_engine, "before_cursor_execute", record)
+
+        # Only the batched last_checked stamp touches the stories table
+        story_updates = [s for s in statements if s.startswith("UPDATE stories")]
+        self.assertEqual(len(story_updates), 1)
+        self.assertTrue(story_updates[0].startswith("UPDATE stories SET last_checked"))
+
+    def test_update_library_keeps_stories_loaded_after_commit(self):
+        for i in range(3):
+            self.manager.add_story(f"http://example.com/story{i}")
+
+        statements = []
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        event.listen(self.test_engine, "before_cursor_execute", record)
+        try:
+            self.manager.update_library()
+        finally:
+            event.remove(self.test_engine, "before_cursor_execute", record)
+
+        # Writing metadata.json after the commit reuses the loaded stories instead of refreshing each
+        story_selects = [s for s in statements if s.startswith("SELECT") and "\nFROM stories" in s]
+        self.assertEqual(len(story_selects), 1)
+
+        # Sessions outside update_library keep the default expiry
+        session = database.SessionLocal()
+        self.assertTrue(session.expire_on_commit)
+        session.close()
+
+    def test_apply_story_metadata_compares_unloaded_attributes(self):
+        story_id = self.manager.add_story("http://example.com/story")
+
+        session = database.SessionLocal()
+        story = session.query(Story).filter(Story.id == story_id).first()
+        session.expire(story, ['author'])
+
+        # Same value as stored: the expired column is loaded and compared, not blindly assigned
+        self.assertFalse(_apply_story_metadata(story, {'author': 'Test Author'}))
+        self.assertNotIn(story, session.dirty)
+        session.close()
+
+    def test_metadata_format_independent_of_orjson(self):
+        story_id = self.manager.add_story("http://example.com/story")
+        session = database.SessionLocal()
+        story = session.query(Story).filter(Story.id == story_id).first()
+        metadata_path = self.manager.library_manager.get_metadata_absolute_path(story)
+
+        outputs = []
+        for has_orjson in (True, False):
+            self.manager._metadata_hashes.clear()
+            with patch('scrollarr.story_manager.HAS_ORJSON', has_orjson):
+                self.manager.save_metadata(story)
+            outputs.append(metadata_path.read_bytes())
+        session.close()
+
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_update_library_isolates_fetch_failures(self):
+        self.manager.add_story("http://example.com/story")
+        self.mock_provider.get_chapter_list.return_value = [
+            {'title': 'Other 1', 'url': 'http://example.com/other/1'}
+        ]
+        other_id = self.manager.add_story("http://example.com/other")
+
+        def chapter_list(url, **kwargs):
+            if url == "http://example.com/story":
+                raise ConnectionError("source down")
+            return [
+                {'title': 'Other 1', 'url': 'http://example.com/other/1'},
+                {'title': 'Other 2', 'url': 'http://example.com/other/2'}
+            ]
+        self.mock_provider.get_chapter_list.side_effect = chapter_list
+
+        self.manager.update_library()
+
+        # The failing story is skipped; the other one still gets its new chapter
+        session = database.SessionLocal()
+        count = session.query(Chapter).filter(Chapter.story_id == other_id).count()
+        session.close()
+        self.assertEqual(count, 2)
+
+    def test_update_library_caps_fetches_per_provider(self):
+        for i in range(6):
+            self.manager.add_story(f"http://example.com/story{i}")
+
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def chapter_list(url, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return []
+        self.mock_provider.get_chapter_list.side_effect = chapter_list
+
+        with patch('scrollarr.story_manager.LIBRARY_FETCH_PER_PROVIDER', 2):
+            self.manager.update_library()
+
+        self.assertEqual(self.mock_provider.get_chapter_list.call_count, 6 + 6)
+        self.assertEqual(peak, 2)
+
+    def test_update_library_rolls_back_only_failing_story(self):
+        broken_id = self.manager.add_story("http://example.com/story")
+        self.mock_provider.get_chapter_list.return_value = [
+            {'title': 'Other 1', 'url': 'http://example.com/other/1'}
+        ]
+        other_id = self.manager.add_story("http://example.com/other")
+
+        def metadata(url):
+            return {'title': f'Renamed {url}', 'author': 'Test Author'}
+
+        def chapter_list(url, **kwargs):
+            if url == "http://example.com/story":
+                # A chapter without a title violates NOT NULL when inserted
+                return [
+                    {'title': 'Chapter 1', 'url': 'http://example.com/1'},
+                    {'title': 'Chapter 2', 'url': 'http://example.com/2'},
+                    {'title': None, 'url': 'http://example.com/3'}
+                ]
+            return [
+                {'title': 'Other 1', 'url': 'http://example.com/other/1'},
+                {'title': 'Other 2', 'url': 'http://example.com/other/2'}
+            ]
+        self.mock_provider.get_metadata.side_effect = metadata
+        self.mock_provider.get_chapter_list.side_effect = chapter_list
+
+        self.manager.update_library()
+
+        session = database.SessionLocal()
+        broken = session.query(Story).filter(Story.id == broken_id).first()
+        other = session.query(Story).filter(Story.id == other_id).first()
+        # The failing story keeps its old state; the other one in the same batch is committed
+        self.assertEqual(broken.title, 'Test Story')
+        self.assertEqual(len(broken.chapters), 2)
+        self.assertEqual(other.title, 'Renamed http://example.com/other')
+        self.assertEqual(len(other.chapters), 2)
+        session.close()
+
+    def test_rollback_discards_released_savepoints(self):
+        session = database.SessionLocal()
+        database.begin_write_transaction(session)
+        with session.begin_nested():
+            session.add(Story(title='Savepoint', author='A', source_url='http://example.com/savepoint'))
+
+        # Released, but still inside the outer transaction: invisible to other connections
+        other = database.SessionLocal()
+        self.assertEqual(other.query(Story).filter(Story.title == 'Savepoint').count(), 0)
+        other.close()
+        self.assertTrue(session.in_transaction())
+
+        session.rollback()
+        self.assertEqual(session.query(Story).filter(Story.title == 'Savepoint').count(), 0)
+        session.close()
+
+    def test_write_after_concurrent_commit(self):
+        story_id = self.manager.add_story("http://example.com/story")
+
+        # The first session reads, then (as during a network fetch) another connection commits
+        session = database.SessionLocal()
+        story = session.query(Story).filter(Story.id == story_id).first()
+        other = database.SessionLocal()
+        other.query(Story).filter(Story.id == story_id).update({Story.author: 'Other Author'})
+        other.commit()
+        other.close()
+
+        # The read left no snapshot behind, so the write goes through
+        story.title = 'Renamed'
+        session.commit()
+        session.close()
+
+        session = database.SessionLocal()
+        story = session.query(Story).filter(Story.id == story_id).first()
+        self.assertEqual((story.title, story.author), ('Renamed', 'Other Author'))
+        session.close()
+
+    def test_update_library_ignores_repeated_urls(self):
+        story_id = self.manager.add_story("http://example.com/story")
+
+        # A scraping glitch lists chapter 1 again after chapter 2, plus a duplicated new chapter
+        self.mock_provider.get_chapter_list.return_value = [
+            {'title': 'Chapter 1', 'url': 'http://example.com/1'},
+            {'title': 'Chapter 2', 'url': 'http://example.com/2'},
+            {'title': 'Chapter 1', 'url': 'http://example.com/1'},
+            {'title': 'Chapter 3', 'url': 'http://example.com/3'},
+            {'title': 'Chapter 3', 'url': 'http://example.com/3'}
+        ]
+
+        self.manager.update_library()
+
+        session = database.SessionLocal()
+        indexes = dict(session.query(Chapter.source_url, Chapter.index).filter(Chapter.story_id == story_id))
+        session.close()
+        self.assertEqual(indexes, {
+            'http://example.com/1': 1,
+            'http://example.com/2': 2,
+            'http://example.com/3': 4
+        })
+
     def test_check_story_updates(self):
         # 1. Add story with 2 chapters
         story_id = self.manager.add_story("http://example.com/story")
@@ -238,6 +492,27 @@ class TestStoryManager(unittest.TestCase):
         self.assertEqual(len(chapters), 3)
         session.close()
 
+    def test_check_story_updates_merges_existing(self):
+        story_id = self.manager.add_story("http://example.com/story")
+
+        # Provider reorders chapters and lists the new one twice
+        self.mock_provider.get_chapter_list.return_value = [
+            {'title': 'Chapter 2', 'url': 'http://example.com/2'},
+            {'title': 'Chapter 1', 'url': 'http://example.com/1'},
+            {'title': 'Chapter 3', 'url': 'http://example.com/3'},
+            {'title': 'Chapter 3', 'url': 'http://example.com/3'}
+        ]
+
+        new_count = self.manager.check_story_updates(story_id)
+        self.assertEqual(new_count, 1)
+
+        session = database.SessionLocal()
+        chapters = session.query(Chapter).filter(Chapter.story_id == story_id).order_by(Chapter.index).all()
+        self.assertEqual([c.source_url for c in chapters], [
+            'http://example.com/2', 'http://example.com/1', 'http://example.com/3'
+        ])
+        session.close()
+
     def test_retry_failed_chapters(self):
         # 1. Add story
         story_id = self.manager.add_story("http://example.com/story")
@@ -297,5 +572,114 @@ class TestStoryManager(unittest.TestCase):
         self.assertEqual(story.tags, 'Tag1, Tag2')
         session.close()
 
+    def test_search(self):
+        self.mock_provider.key = 'first'
+        self.mock_provider.search.return_value = [{'title': 'A'}]
+
+        failing_provider = MagicMock()
+        failing_provider.key = 'broken'
+        failing_provider.search.side_effect = Exception("Network down")
+
+        other_provider = MagicMock()
+        other_provider.key = 'second'
+        other_provider.search.return_value = [{'title': 'B'}]
+
+        self.manager.source_manager.providers = [self.mock_provider, failing_provider, other_provider]
+
+        # Results keep provider order and skip providers that raised
+        results = self.manager.search("query")
+        self.assertEqual([r['title'] for r in results], ['A', 'B'])
+
+        # Filtering by key only queries the matching provider
+        results = self.manager.search("query", provider_key='second')
+        self.assertEqual([r['title'] for r in results], ['B'])
+        self.assertEqual(self.mock_provider.search.call_count, 1)
+
+    def test_save_metadata_skips_unchanged(self):
+        story_id = self.manager.add_story("http://example.com/story")
+
+        session = database.SessionLocal()
+        story = session.query(Story).filter(Story.id == story_id).first()
+        metadata_path = self.manager.library_manager.get_metadata_absolute_path(story)
+        session.close()
+        self.assertTrue(metadata_path.exists())
+
+        with patch.object(Path, 'write_bytes') as mock_write:
+            # Each pass bumps last_checked, which alone does not warrant a rewrite
+            self.manager.update_library()
+            self.manager.update_library()
+            mock_write.assert_not_called()
+
+            self.mock_provider.get_metadata.return_value = dict(
+                self.mock_provider.get_metadata.return_value, description='Changed'
+            )
+            self.manager.update_library()
+            mock_write.assert_called_once()
+
+    def test_get_story_schedule(self):
+        self.mock_provider.get_chapter_list.return_value = [
+            {'title': 'Chapter 1', 'url': 'http://example.com/1', 'published_date': datetime(2024, 1, 1)},
+            {'title': 'Chapter 2', 'url': 'http://example.com/2', 'published_date': datetime(2024, 1, 2)},
+            {'title': 'Chapter 3', 'url': 'http://example.com/3', 'published_date': datetime(2024, 1, 5)}
+        ]
+        story_id = self.manager.add_story("http://example.com/story")
+
+        schedule = self.manager.get_story_schedule(story_id)
+        self.assertEqual(schedule['history_count'], 3)
+        self.assertEqual(schedule['avg_interval_days'], 2)
+        self.assertEqual(schedule['prediction'], datetime(2024, 1, 7))
+
+    def test_get_calendar_events(self):
+        self.mock_provider.get_chapter_list.return_value = [
+            {'title': 'Chapter 1', 'url': 'http://example.com/1', 'published_date': datetime(2024, 1, 1)},
+            {'title': 'Chapter 2', 'url': 'http://example.com/2', 'published_date': datetime(2024, 1, 3)},
+            {'title': 'Chapter 3', 'url': 'http://example.com/3', 'published_date': datetime(2024, 1, 5)}
+        ]
+        self.manager.add_story("http://example.com/story")
+
+        events = self.manager.get_calendar_events()
+        self.assertNotIsInstance(events, list)
+        before = datetime.now()
+        events = list(events)
+
+        history = [e for e in events if not e.get('allDay')]
+        predicted = [e for e in events if e.get('allDay')]
+        self.assertEqual(len(history), 3)
+        self.assertEqual(len(predicted), 5)
+        self.assertIn('Test Story - Chapter 1', [e['title'] for e in history])
+        self.assertIn('2024-01-01T00:00:00', [e['start'] for e in history])
+
+        # Predictions keep the two-day cadence and land in the future
+        first = datetime.fromisoformat(predicted[0]['start'])
+        second = datetime.fromisoformat(predicted[1]['start'])
+        self.assertGreaterEqual(first, before)
+        self.assertLess(first, before + timedelta(days=2))
+        self.assertEqual((first - datetime(2024, 1, 5)) % timedelta(days=2), timedelta(0))
+        self.assertEqual(second - first, timedelta(days=2))
+
+    def test_get_calendar_events_keeps_microseconds(self):
+        published = [datetime(2024, 1, 1, 8, 30, 0, 250000), datetime(2024, 1, 3, 8, 30)]
+        self.mock_provider.get_chapter_list.return_value = [
+            {'title': f'Chapter {i}', 'url': f'http://example.com/{i}', 'published_date': date}
+            for i, date in enumerate(published, 1)
+        ]
+        self.manager.add_story("http://example.com/story")
+
+        history = [e for e in self.manager.get_calendar_events() if not e.get('allDay')]
+        # Same strings datetime.isoformat() gives, fraction included only when non-zero
+        self.assertEqual([e['start'] for e in history], [date.isoformat() for date in published])
+
+    def test_get_calendar_events_skips_zero_cadence(self):
+        self.mock_provider.get_chapter_list.return_value = [
+            {'title': 'Chapter 1', 'url': 'http://example.com/1', 'published_date': datetime(2024, 1, 1)},
+            {'title': 'Chapter 2', 'url': 'http://example.com/2', 'published_date': datetime(2024, 1, 1)}
+        ]
+        self.manager.add_story("http://example.com/story")
+
+        events = list(self.manager.get_calendar_events())
+
+        self.assertEqual(len(events), 2)
+        self.assertFalse(any(e.get('allDay') for e in events))
+
 if __name__ == '__main__':
     unittest.main()